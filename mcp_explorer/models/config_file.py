@@ -1,5 +1,6 @@
 """Config file domain model."""
 
+from pathlib import Path
 from typing import List
 
 from pydantic import BaseModel, Field
@@ -22,15 +23,13 @@ class ConfigFile(BaseModel):
 
     def get_display_path(self) -> str:
         """Get shortened display path for UI."""
-        from pathlib import Path
-
         try:
             path = Path(self.path)
             home = Path.home()
             if path.is_relative_to(home):
                 return f"~/{path.relative_to(home)}"
-        except (ValueError, Exception):
-            pass
+        except RuntimeError:
+            pass  # Home directory can't be determined
 
         return self.path
 
@@ -2,7 +2,7 @@
 
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class PromptArgument(BaseModel):
@@ -12,6 +12,12 @@ class PromptArgument(BaseModel):
     description: Optional[str] = None
     required: bool = False
 
+    def get_display_line(self) -> str:
+        """Get a bullet line describing the argument for detail views."""
+        description = f" - {self.description}" if self.description else ""
+        requirement = " [REQUIRED]" if self.required else " [optional]"
+        return f"• {self.name}{description}{requirement}"
+
     @classmethod
     def from_mcp_argument(cls, arg_data: Any) -> "PromptArgument":
         """Create PromptArgument from MCP argument data."""
@@ -29,6 +35,9 @@ class MCPPrompt(BaseModel):
     description: Optional[str] = None
     arguments: list[PromptArgument] = Field(default_factory=list)
 
+    # Formatted argument listing, rendered on first request
+    _arguments_text: Optional[str] = PrivateAttr(default=None)
+
     def get_argument_summary(self) -> str:
         """Get a human-readable summary of arguments."""
         if not self.arguments:
@@ -45,6 +54,12 @@ class MCPPrompt(BaseModel):
 
         return " | ".join(parts)
 
+    def get_arguments_text(self) -> str:
+        """Get the argument listing for detail views, cached after the first call."""
+        if self._arguments_text is None:
+            self._arguments_text = "\n\n".join(arg.get_display_line() for arg in self.arguments)
+        return self._arguments_text
+
     @classmethod
     def from_mcp_prompt(cls, prompt_data: Any) -> "MCPPrompt":
         """Create MCPPrompt from MCP prompt data."""
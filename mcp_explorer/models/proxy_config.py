@@ -71,6 +71,19 @@ class ProxyConfig(BaseModel):
             return False  # No tools enabled by default for this server
         return tool_name in self.enabled_tools[server_key]
 
+    def get_enabled_tool_names(self, config_file_path: str, server_name: str) -> set[str]:
+        """Get the names of the enabled tools for a server.
+
+        Args:
+            config_file_path: Path to the config file
+            server_name: Name of the server
+
+        Returns:
+            Set of enabled tool names (empty if none are enabled)
+        """
+        server_key = self.make_server_key(config_file_path, server_name)
+        return self.enabled_tools.get(server_key, set())
+
     def is_resource_enabled(
         self, config_file_path: str, server_name: str, resource_uri: str
     ) -> bool:
@@ -87,6 +87,10 @@ class MCPServer(BaseModel):
 
         return " ".join(parts)
 
+    def get_server_info_display(self) -> tuple[tuple[str, str], ...]:
+        """Get (label, value) pairs for the non-empty server metadata entries."""
+        return tuple((key.title(), str(value)) for key, value in self.server_info.items() if value)
+
     def mark_connected(self) -> None:
         """Mark server as connected."""
         self.status = ServerStatus.CONNECTED
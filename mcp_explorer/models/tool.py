@@ -1,8 +1,9 @@
 """Tool domain model."""
 
+import json
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class ToolParameter(BaseModel):
@@ -36,6 +37,9 @@ class MCPTool(BaseModel):
     parameters: list[ToolParameter] = Field(default_factory=list)
     input_schema: Dict[str, Any] = Field(default_factory=dict)
 
+    # Pretty-printed input schema, rendered on first request
+    _schema_json: Optional[str] = PrivateAttr(default=None)
+
     def get_parameter_summary(self) -> str:
         """Get a human-readable summary of parameters."""
         if not self.parameters:
@@ -52,6 +56,15 @@ class MCPTool(BaseModel):
 
         return " | ".join(parts)
 
+    def get_schema_json(self) -> str:
+        """Get the input schema pretty-printed as JSON, cached after the first call."""
+        if self._schema_json is None:
+            # 2-space indentation and sorted keys for readability
+            self._schema_json = json.dumps(
+                self.input_schema, indent=2, sort_keys=True, ensure_ascii=False
+            )
+        return self._schema_json
+
     @classmethod
     def from_mcp_tool(cls, tool_data: Any) -> "MCPTool":
         """Create MCPTool from MCP tool data."""
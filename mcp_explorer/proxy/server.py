@@ -1,11 +1,14 @@
 """MCP Proxy Server implementation using FastMCP v3 create_proxy() and middleware."""
 
 import asyncio
+import os
+import socket
 import time
 import uuid
 from pathlib import Path
 from typing import Any
 
+import uvicorn
 from fastmcp.server import create_proxy
 from fastmcp.server.middleware import Middleware, MiddlewareContext, PingMiddleware
 from fastmcp.server.middleware.error_handling import ErrorHandlingMiddleware
@@ -20,6 +23,44 @@ from starlette.responses import Response
 from ..models import MCPServer, ProxyConfig, ServerType
 from .logger import ProxyLogger
 
+# How long stop() waits for uvicorn to finish a graceful shutdown before cancelling it
+SHUTDOWN_TIMEOUT = 2.0
+
+# Address the proxy listens on; numeric, so binding doesn't resolve "localhost" every start
+LISTEN_HOST = "127.0.0.1"
+
+
+def _bind_listener(sockaddr: tuple[str, int]) -> socket.socket:
+    """Bind the proxy's listening socket, allowing the port to be reused straight away.
+
+    SO_REUSEADDR is set before binding so a restarted proxy can take its port back while
+    connections from the previous listener are still in TIME_WAIT.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        # On Windows SO_REUSEADDR allows binding a port that's in use, so leave it unset there
+        if os.name != "nt":
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind(sockaddr)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+class _ReadyUvicornServer(uvicorn.Server):
+    """Uvicorn server that sets an event once it is listening."""
+
+    def __init__(self, config: uvicorn.Config, ready: asyncio.Event) -> None:
+        super().__init__(config)
+        self._ready = ready
+
+    async def startup(self, sockets: list[Any] | None = None) -> None:
+        """Start the server, then signal readiness if it bound successfully."""
+        await super().startup(sockets=sockets)
+        if self.started:
+            self._ready.set()
+
 
 class SSEClientTrackingMiddleware(BaseHTTPMiddleware):
     """Middleware to track SSE client connections and disconnections."""
@@ -208,8 +249,16 @@ class ProxyServer:
         self._running = False
         self._server_task: asyncio.Task | None = None
         self._uvicorn_server: Any | None = None
+        self._socket: socket.socket | None = None
+
+        # Port actually bound; differs from config.port when that's 0 (any free port)
+        self.port = config.port
         self._connected_clients: set[str] = set()
 
+        # Set once the listener is bound, and once stop() has finished releasing it
+        self._ready = asyncio.Event()
+        self._stopped = asyncio.Event()
+
         # Build MCP config from enabled servers only
         mcp_config = self._build_mcp_config()
 
@@ -287,6 +336,8 @@ class ProxyServer:
     async def start(self) -> None:
         """Start the proxy server with both HTTP (/mcp) and SSE (/sse) endpoints."""
         self._running = True
+        self._ready.clear()
+        self._stopped.clear()
 
         # Set up log file
         log_dir = Path.home() / ".mcp-explorer" / "proxy-logs"
@@ -299,23 +350,27 @@ class ProxyServer:
             1 for s in self.servers if self.config.is_server_enabled(s.source_file or "", s.name)
         )
 
-        # Log server start
-        if self.config.enable_logging:
-            msg = (
-                f"Proxy server starting on http://localhost:{self.config.port} "
-                f"with {enabled_count} enabled servers\n"
-                f"  HTTP endpoint: http://localhost:{self.config.port}/mcp\n"
-                f"  SSE endpoint:  http://localhost:{self.config.port}/sse"
-            )
-            self.logger.log_server_started(
-                port=self.config.port,
-                enabled_servers=enabled_count,
-                message=msg,
-            )
-
         try:
+            # Bind the listener ourselves so it's reusable on restart, and so a busy port
+            # raises here instead of uvicorn exiting the process
+            self._socket = _bind_listener((LISTEN_HOST, self.config.port))
+            self.port = self._socket.getsockname()[1]
+
+            # Log server start
+            if self.config.enable_logging:
+                msg = (
+                    f"Proxy server starting on http://localhost:{self.port} "
+                    f"with {enabled_count} enabled servers\n"
+                    f"  HTTP endpoint: http://localhost:{self.port}/mcp\n"
+                    f"  SSE endpoint:  http://localhost:{self.port}/sse"
+                )
+                self.logger.log_server_started(
+                    port=self.port,
+                    enabled_servers=enabled_count,
+                    message=msg,
+                )
+
             # Import required modules
-            import uvicorn
             from fastmcp.server.http import create_sse_app
             from starlette.routing import Mount
 
@@ -334,23 +389,29 @@ class ProxyServer:
             # Run the combined app with uvicorn
             config = uvicorn.Config(
                 app,
-                host="localhost",
-                port=self.config.port,
+                host=LISTEN_HOST,
+                port=self.port,
                 log_level="error",  # Reduce noise
             )
-            server = uvicorn.Server(config)
+            server = _ReadyUvicornServer(config, self._ready)
 
             # Store server instance and task for cleanup
             self._uvicorn_server = server
-            self._server_task = asyncio.create_task(server.serve())
-            await self._server_task
+            self._server_task = asyncio.create_task(server.serve(sockets=[self._socket]))
+            try:
+                await self._server_task
+            except asyncio.CancelledError:
+                # stop() cancels the serve task if it doesn't shut down in time; start()
+                # still returns normally then, and only propagates its own cancellation
+                if self._running:
+                    raise
 
         except Exception as e:
             # Log server error
             if self.config.enable_logging:
                 self.logger.log_server_error(
                     error=str(e),
-                    details={"port": self.config.port, "exception_type": type(e).__name__},
+                    details={"port": self.port, "exception_type": type(e).__name__},
                 )
             raise
 
@@ -367,8 +428,9 @@ class ProxyServer:
         # Shut down the uvicorn server properly to release the port
         if self._uvicorn_server:
             self._uvicorn_server.should_exit = True
-            # Wait for server to signal shutdown
-            await asyncio.sleep(0.2)
+            # Wait for the server to finish shutting down, cancelling it below if it doesn't
+            if self._server_task and not self._server_task.done():
+                await asyncio.wait({self._server_task}, timeout=SHUTDOWN_TIMEOUT)
 
         # Stop the server task
         if self._server_task and not self._server_task.done():
@@ -380,11 +442,27 @@ class ProxyServer:
             except Exception as e:
                 print(f"Error stopping server: {e}")
 
-        # Give the OS time to release the socket
-        await asyncio.sleep(0.3)
+        # Uvicorn closes its listeners on a graceful shutdown but never waits for them, and
+        # skips closing them if it was cancelled; close them and wait until they're torn down
+        listeners = getattr(self._uvicorn_server, "servers", [])
+        for listener in listeners:
+            listener.close()
+        if listeners:
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(*(listener.wait_closed() for listener in listeners)),
+                    timeout=SHUTDOWN_TIMEOUT,
+                )
+            except TimeoutError:
+                pass  # Lingering connections; the listening socket itself is already closed
+
+        if self._socket:
+            self._socket.close()
 
         self._server_task = None
+        self._socket = None
         self._uvicorn_server = None
+        self._stopped.set()
 
     def is_running(self) -> bool:
         """Check if the proxy server is running."""
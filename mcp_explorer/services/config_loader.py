@@ -62,44 +62,71 @@ class MCPConfigLoader:
         try:
             with open(config_path, "r") as f:
                 content = f.read()
-
-            # Try strict JSON first
-            try:
-                json.loads(content)
-                return True, None
-            except json.JSONDecodeError as json_err:
-                # If strict JSON fails, try JSON5
-                if JSON5_AVAILABLE:
-                    try:
-                        pyjson5.loads(content)
-                        return True, None
-                    except Exception as json5_err:
-                        # Both failed, report JSON5 error if available, else JSON error
-                        return False, f"Invalid JSON/JSON5: {str(json5_err)}"
-                else:
-                    # No JSON5 support, report JSON error
-                    return (
-                        False,
-                        f"Invalid JSON at line {json_err.lineno}, column {json_err.colno}: {json_err.msg}",
-                    )
-
         except IOError as e:
             return False, f"Cannot read file: {e}"
 
+        return MCPConfigLoader.validate_json_content(content)
+
+    @staticmethod
+    def validate_json_content(content: str) -> Tuple[bool, Optional[str]]:
+        """Validate JSON/JSON5 syntax of config file content.
+
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        # Try strict JSON first
+        try:
+            json.loads(content)
+            return True, None
+        except json.JSONDecodeError as json_err:
+            # If strict JSON fails, try JSON5
+            if JSON5_AVAILABLE:
+                try:
+                    pyjson5.loads(content)
+                    return True, None
+                except Exception as json5_err:
+                    # Both failed, report JSON5 error if available, else JSON error
+                    return False, f"Invalid JSON/JSON5: {str(json5_err)}"
+            else:
+                # No JSON5 support, report JSON error
+                return (
+                    False,
+                    f"Invalid JSON at line {json_err.lineno}, column {json_err.colno}: {json_err.msg}",
+                )
+
     @staticmethod
     def load_config_file(config_path: Path) -> Optional[Dict[str, Any]]:
         """Load configuration from a JSON/JSON5 file with validation."""
+        # Read the file once; validation and parsing both work on its content
+        try:
+            with open(config_path, "r") as f:
+                content = f.read()
+        except IOError as e:
+            print(f"⚠ Config validation failed for {config_path}:")
+            print(f"  Cannot read file: {e}")
+            return None
+
+        return MCPConfigLoader.parse_config_content(content, config_path)
+
+    @staticmethod
+    def parse_config_content(content: str, config_path: Path) -> Optional[Dict[str, Any]]:
+        """Parse configuration already read from a JSON/JSON5 file, with validation.
+
+        Args:
+            content: Content of the config file
+            config_path: Path the content was read from, used in messages
+
+        Returns:
+            The configuration, or None if it is invalid
+        """
         # First validate JSON syntax
-        is_valid, error_msg = MCPConfigLoader.validate_json_syntax(config_path)
+        is_valid, error_msg = MCPConfigLoader.validate_json_content(content)
         if not is_valid:
             print(f"⚠ Config validation failed for {config_path}:")
             print(f"  {error_msg}")
             return None
 
         try:
-            with open(config_path, "r") as f:
-                content = f.read()
-
             # Try strict JSON first
             try:
                 config = json.loads(content)
@@ -1,6 +1,8 @@
 """Proxy configuration screen."""
 
 import asyncio
+from collections import deque
+from functools import cached_property
 from typing import Any
 
 from textual import on
@@ -11,6 +13,7 @@ from textual.widgets import Button, Footer, Header, Input, Label, Static, Tree
 from textual.widgets._tree import TreeNode
 
 from ..models import MCPServer, ProxyConfig, ConfigFile
+from ..proxy import ProxyServer
 
 
 class ProxyConfigScreen(Screen[None]):
@@ -21,6 +24,13 @@ class ProxyConfigScreen(Screen[None]):
         ("q", "quit", "Quit"),
     ]
 
+    # Rich markup for the bulk toggle buttons on config file and category nodes
+    _ENABLE_ALL = "[bold green][Enable All][/bold green]"
+    _DISABLE_ALL = "[bold red][Disable All][/bold red]"
+
+    # Delay before persisting config changes, coalescing rapid edits into one write
+    SAVE_DEBOUNCE_SECONDS = 0.3
+
     def __init__(self, config_files: list[ConfigFile], config: ProxyConfig) -> None:
         """Initialize the proxy config screen.
 
@@ -32,10 +42,23 @@ class ProxyConfigScreen(Screen[None]):
         self.config_files = config_files
         self.config = config
 
-        # Flatten servers for backward compatibility with existing proxy logic
-        self.servers: list[MCPServer] = []
-        for config_file in config_files:
-            self.servers.extend(config_file.servers)
+        # Composite proxy-config keys, computed once per (config path, server name)
+        self._server_keys: dict[tuple[str, str], str] = {
+            (config_file.path, server.name): config.make_server_key(config_file.path, server.name)
+            for config_file in config_files
+            for server in config_file.servers
+        }
+
+        # Connected servers per config file path, filled lazily by _connected_servers()
+        self._connected_cache: dict[str, list[MCPServer]] = {}
+
+        # Pending debounced save, replaced on every change
+        self._save_task: asyncio.Task[None] | None = None
+
+    @cached_property
+    def servers(self) -> list[MCPServer]:
+        """Flat list of servers for the existing proxy logic, built on first use."""
+        return [server for config_file in self.config_files for server in config_file.servers]
 
     def compose(self) -> ComposeResult:
         """Compose the proxy config screen."""
@@ -73,7 +96,7 @@ class ProxyConfigScreen(Screen[None]):
             # Server configurations as unified tree
             yield Label("Select Servers and Capabilities to Proxy", classes="section-title")
             with VerticalScroll(id="server-configs"):
-                if not self.servers:
+                if not any(config_file.servers for config_file in self.config_files):
                     yield Static("No servers available", classes="empty-state")
                 else:
                     # Create single tree with all servers grouped by config file
@@ -86,20 +109,14 @@ class ProxyConfigScreen(Screen[None]):
                     # Use hierarchical config file structure
                     for config_file in self.config_files:
                         # Count connected servers in this config
-                        connected_servers = [
-                            s for s in config_file.servers if s.status.value == "connected"
-                        ]
+                        connected_servers = self._connected_servers(config_file)
 
                         # Count enabled servers in this config
                         enabled_server_count = self._count_enabled_servers(config_file)
 
                         # Determine if all servers/capabilities in this config are enabled
                         all_enabled = self._is_config_file_fully_enabled(config_file)
-                        button_text = (
-                            "[bold red][Disable All][/bold red]"
-                            if all_enabled
-                            else "[bold green][Enable All][/bold green]"
-                        )
+                        button_text = self._DISABLE_ALL if all_enabled else self._ENABLE_ALL
 
                         # Add config file node with enable/disable button and x/y counter
                         config_node = tree.root.add(
@@ -135,6 +152,24 @@ class ProxyConfigScreen(Screen[None]):
             # Dim gray for disabled items
             return f"[dim]{text}[/dim]"
 
+    def _connected_servers(self, config_file: ConfigFile) -> list[MCPServer]:
+        """Get the connected servers of a config file, cached per screen instance.
+
+        Server status does not change while this screen is open, so the filter is
+        computed once per config file and reused by compose and the tree handlers.
+
+        Args:
+            config_file: The config file to filter
+
+        Returns:
+            Servers from the config file whose status is connected
+        """
+        connected = self._connected_cache.get(config_file.path)
+        if connected is None:
+            connected = [s for s in config_file.servers if s.status.value == "connected"]
+            self._connected_cache[config_file.path] = connected
+        return connected
+
     def _count_enabled_servers(self, config_file: ConfigFile) -> int:
         """Count how many servers in a config file have at least one enabled capability.
 
@@ -146,10 +181,7 @@ class ProxyConfigScreen(Screen[None]):
         """
         enabled_count = 0
 
-        for server in config_file.servers:
-            if server.status.value != "connected":
-                continue
-
+        for server in self._connected_servers(config_file):
             has_enabled = False
 
             # Check if any tool is enabled
@@ -188,10 +220,7 @@ class ProxyConfigScreen(Screen[None]):
         """
         has_any_capability = False
 
-        for server in config_file.servers:
-            if server.status.value != "connected":
-                continue
-
+        for server in self._connected_servers(config_file):
             # Check all tools
             for tool in server.tools:
                 has_any_capability = True
@@ -223,6 +252,8 @@ class ProxyConfigScreen(Screen[None]):
             config_file_path: Path to the config file this server is from
             server: MCP server to add
         """
+        server_key = self._server_keys[(config_file_path, server.name)]
+
         # Add server as first-level node (no checkbox, no color formatting)
         server_node = parent.add(
             server.name,
@@ -232,23 +263,14 @@ class ProxyConfigScreen(Screen[None]):
 
         # Add tools
         if server.tools:
-            # Count enabled tools
-            enabled_tools = sum(
-                1
-                for t in server.tools
-                if self.config.is_tool_enabled(config_file_path, server.name, t.name)
-            )
+            # Count enabled tools with set operations instead of per-tool lookups
+            tool_names = {t.name for t in server.tools}
+            enabled_set = self.config.enabled_tools.get(server_key, set())
+            enabled_tools = len(tool_names & enabled_set)
 
             # Add category with enable/disable buttons and x/y counter
-            all_enabled = all(
-                self.config.is_tool_enabled(config_file_path, server.name, t.name)
-                for t in server.tools
-            )
-            button_text = (
-                "[bold red][Disable All][/bold red]"
-                if all_enabled
-                else "[bold green][Enable All][/bold green]"
-            )
+            all_enabled = enabled_tools == len(tool_names)
+            button_text = self._DISABLE_ALL if all_enabled else self._ENABLE_ALL
             tools_category = server_node.add(
                 f"Tools ({enabled_tools}/{len(server.tools)}) {button_text}",
                 data={
@@ -256,13 +278,17 @@ class ProxyConfigScreen(Screen[None]):
                     "category": "tools",
                     "server": server.name,
                     "config_path": config_file_path,
+                    "server_key": server_key,
                 },
                 expand=False,
             )
             for tool in server.tools:
-                tool_enabled = self.config.is_tool_enabled(config_file_path, server.name, tool.name)
-                tool_checkbox = "☑" if tool_enabled else "☐"
-                label = self._format_label(f"{tool_checkbox} {tool.name}", tool_enabled)
+                tool_enabled = tool.name in enabled_set
+                label = (
+                    f"[bold green]☑ {tool.name}[/bold green]"
+                    if tool_enabled
+                    else f"[dim]☐ {tool.name}[/dim]"
+                )
                 tools_category.add_leaf(
                     label,
                     data={
@@ -270,27 +296,21 @@ class ProxyConfigScreen(Screen[None]):
                         "server": server.name,
                         "name": tool.name,
                         "config_path": config_file_path,
+                        "server_key": server_key,
+                        "display": tool.name,
+                        "enabled": tool_enabled,
                     },
                 )
 
         # Add resources
         if server.resources:
             # Count enabled resources
-            enabled_resources = sum(
-                1
-                for r in server.resources
-                if self.config.is_resource_enabled(config_file_path, server.name, r.uri)
-            )
+            resource_uris = {r.uri for r in server.resources}
+            enabled_set = self.config.enabled_resources.get(server_key, set())
+            enabled_resources = len(resource_uris & enabled_set)
 
-            all_enabled = all(
-                self.config.is_resource_enabled(config_file_path, server.name, r.uri)
-                for r in server.resources
-            )
-            button_text = (
-                "[bold red][Disable All][/bold red]"
-                if all_enabled
-                else "[bold green][Enable All][/bold green]"
-            )
+            all_enabled = enabled_resources == len(resource_uris)
+            button_text = self._DISABLE_ALL if all_enabled else self._ENABLE_ALL
             resources_category = server_node.add(
                 f"Resources ({enabled_resources}/{len(server.resources)}) {button_text}",
                 data={
@@ -298,16 +318,17 @@ class ProxyConfigScreen(Screen[None]):
                     "category": "resources",
                     "server": server.name,
                     "config_path": config_file_path,
+                    "server_key": server_key,
                 },
                 expand=False,
             )
             for resource in server.resources:
-                resource_enabled = self.config.is_resource_enabled(
-                    config_file_path, server.name, resource.uri
-                )
-                resource_checkbox = "☑" if resource_enabled else "☐"
-                label = self._format_label(
-                    f"{resource_checkbox} {resource.get_display_name()}", resource_enabled
+                resource_enabled = resource.uri in enabled_set
+                display_name = resource.get_display_name()
+                label = (
+                    f"[bold green]☑ {display_name}[/bold green]"
+                    if resource_enabled
+                    else f"[dim]☐ {display_name}[/dim]"
                 )
                 resources_category.add_leaf(
                     label,
@@ -316,27 +337,21 @@ class ProxyConfigScreen(Screen[None]):
                         "server": server.name,
                         "uri": resource.uri,
                         "config_path": config_file_path,
+                        "server_key": server_key,
+                        "display": display_name,
+                        "enabled": resource_enabled,
                     },
                 )
 
         # Add prompts
         if server.prompts:
             # Count enabled prompts
-            enabled_prompts = sum(
-                1
-                for p in server.prompts
-                if self.config.is_prompt_enabled(config_file_path, server.name, p.name)
-            )
+            prompt_names = {p.name for p in server.prompts}
+            enabled_set = self.config.enabled_prompts.get(server_key, set())
+            enabled_prompts = len(prompt_names & enabled_set)
 
-            all_enabled = all(
-                self.config.is_prompt_enabled(config_file_path, server.name, p.name)
-                for p in server.prompts
-            )
-            button_text = (
-                "[bold red][Disable All][/bold red]"
-                if all_enabled
-                else "[bold green][Enable All][/bold green]"
-            )
+            all_enabled = enabled_prompts == len(prompt_names)
+            button_text = self._DISABLE_ALL if all_enabled else self._ENABLE_ALL
             prompts_category = server_node.add(
                 f"Prompts ({enabled_prompts}/{len(server.prompts)}) {button_text}",
                 data={
@@ -344,15 +359,17 @@ class ProxyConfigScreen(Screen[None]):
                     "category": "prompts",
                     "server": server.name,
                     "config_path": config_file_path,
+                    "server_key": server_key,
                 },
                 expand=False,
             )
             for prompt in server.prompts:
-                prompt_enabled = self.config.is_prompt_enabled(
-                    config_file_path, server.name, prompt.name
+                prompt_enabled = prompt.name in enabled_set
+                label = (
+                    f"[bold green]☑ {prompt.name}[/bold green]"
+                    if prompt_enabled
+                    else f"[dim]☐ {prompt.name}[/dim]"
                 )
-                prompt_checkbox = "☑" if prompt_enabled else "☐"
-                label = self._format_label(f"{prompt_checkbox} {prompt.name}", prompt_enabled)
                 prompts_category.add_leaf(
                     label,
                     data={
@@ -360,25 +377,28 @@ class ProxyConfigScreen(Screen[None]):
                         "server": server.name,
                         "name": prompt.name,
                         "config_path": config_file_path,
+                        "server_key": server_key,
+                        "display": prompt.name,
+                        "enabled": prompt_enabled,
                     },
                 )
 
     @on(Input.Changed, "#proxy-port")
     def update_port(self, event: Input.Changed) -> None:
         """Update proxy port."""
-        try:
-            port = int(event.value)
-            if 1 <= port <= 65535:
-                self.config.port = port
-                self._auto_save_config()
-        except ValueError:
-            pass  # Invalid port number, ignore
+        # Reject anything that cannot be a 1-5 digit port before parsing it
+        value = event.value
+        if not value or len(value) > 5 or not (value.isascii() and value.isdigit()):
+            return
+
+        port = int(value)
+        if 1 <= port <= 65535:
+            self.config.port = port
+            self._auto_save_config()
 
     @on(Button.Pressed, "#toggle-proxy")
     async def toggle_proxy(self) -> None:
         """Toggle proxy running state."""
-        from ..proxy import ProxyServer
-
         self.config.enabled = not self.config.enabled
 
         # Start or stop the proxy server
@@ -389,8 +409,9 @@ class ProxyConfigScreen(Screen[None]):
                     await self.app.proxy_server.stop()
                 self.app.proxy_server = None
 
-            # Create and start new proxy server
-            self.app.proxy_server = ProxyServer(
+            # Create the proxy off the event loop; building the backend proxy is not free
+            self.app.proxy_server = await asyncio.to_thread(
+                ProxyServer,
                 servers=self.servers,
                 config=self.config,
                 logger=self.app.proxy_logger,
@@ -450,12 +471,9 @@ class ProxyConfigScreen(Screen[None]):
             new_enabled = not all_enabled
 
             # Toggle all capabilities for all servers in this config
-            for server in config_file.servers:
-                if server.status.value != "connected":
-                    continue
-
+            for server in self._connected_servers(config_file):
                 # Get the server key for this config
-                server_key = self.config.make_server_key(config_file.path, server.name)
+                server_key = self._server_keys[(config_file.path, server.name)]
 
                 # Initialize server in config if needed
                 if server_key not in self.config.enabled_tools:
@@ -466,40 +484,38 @@ class ProxyConfigScreen(Screen[None]):
                     self.config.enabled_prompts[server_key] = set()
 
                 # Toggle all tools
-                for tool in server.tools:
-                    if new_enabled:
-                        self.config.enabled_tools[server_key].add(tool.name)
-                    else:
-                        self.config.enabled_tools[server_key].discard(tool.name)
+                tool_ids = {t.name for t in server.tools}
+                if new_enabled:
+                    self.config.enabled_tools[server_key] |= tool_ids
+                else:
+                    self.config.enabled_tools[server_key] -= tool_ids
 
                 # Toggle all resources
-                for resource in server.resources:
-                    if new_enabled:
-                        self.config.enabled_resources[server_key].add(resource.uri)
-                    else:
-                        self.config.enabled_resources[server_key].discard(resource.uri)
+                resource_ids = {r.uri for r in server.resources}
+                if new_enabled:
+                    self.config.enabled_resources[server_key] |= resource_ids
+                else:
+                    self.config.enabled_resources[server_key] -= resource_ids
 
                 # Toggle all prompts
-                for prompt in server.prompts:
-                    if new_enabled:
-                        self.config.enabled_prompts[server_key].add(prompt.name)
-                    else:
-                        self.config.enabled_prompts[server_key].discard(prompt.name)
+                prompt_ids = {p.name for p in server.prompts}
+                if new_enabled:
+                    self.config.enabled_prompts[server_key] |= prompt_ids
+                else:
+                    self.config.enabled_prompts[server_key] -= prompt_ids
 
             # Update config file node label
-            connected_servers = [s for s in config_file.servers if s.status.value == "connected"]
+            connected_servers = self._connected_servers(config_file)
             enabled_server_count = self._count_enabled_servers(config_file)
-            button_text = (
-                "[bold red][Disable All][/bold red]"
-                if new_enabled
-                else "[bold green][Enable All][/bold green]"
-            )
-            node.set_label(
-                f"📁 {config_file.get_display_path()} ({enabled_server_count}/{len(connected_servers)}) {button_text}"
-            )
+            button_text = self._DISABLE_ALL if new_enabled else self._ENABLE_ALL
+            # Relabel the whole branch inside a batch so the tree repaints once
+            with self.app.batch_update():
+                node.set_label(
+                    f"📁 {config_file.get_display_path()} ({enabled_server_count}/{len(connected_servers)}) {button_text}"
+                )
 
-            # Update all child nodes recursively
-            self._update_tree_branch(node, new_enabled)
+                # Update all child nodes recursively
+                self._update_tree_branch(node, new_enabled)
 
             # Auto-save configuration
             self._auto_save_config()
@@ -526,79 +542,71 @@ class ProxyConfigScreen(Screen[None]):
                 return
 
             # Get server key
-            server_key = self.config.make_server_key(config_path, server_name)
+            server_key = node.data["server_key"]
 
-            # Determine if we should enable or disable all
-            if category == "tools":
-                all_enabled = all(
-                    self.config.is_tool_enabled(config_path, server_name, t.name)
-                    for t in server.tools
-                )
-                new_enabled = not all_enabled
+            # Batch label updates so the tree repaints once for the whole category
+            with self.app.batch_update():
+                # Determine if we should enable or disable all
+                if category == "tools":
+                    if server_key not in self.config.enabled_tools:
+                        self.config.enabled_tools[server_key] = set()
 
-                if server_key not in self.config.enabled_tools:
-                    self.config.enabled_tools[server_key] = set()
+                    tool_ids = {t.name for t in server.tools}
+                    enabled_set = self.config.enabled_tools[server_key]
+                    new_enabled = not tool_ids <= enabled_set
 
-                for tool in server.tools:
+                    # Apply the whole category with one set operation
                     if new_enabled:
-                        self.config.enabled_tools[server_key].add(tool.name)
+                        enabled_set |= tool_ids
                     else:
-                        self.config.enabled_tools[server_key].discard(tool.name)
+                        enabled_set -= tool_ids
 
-                # Update child nodes
-                for child in node.children:
-                    self._update_node_label(child, new_enabled)
+                    # Update child nodes
+                    for child in node.children:
+                        self._update_node_label(child, new_enabled)
 
-            elif category == "resources":
-                all_enabled = all(
-                    self.config.is_resource_enabled(config_path, server_name, r.uri)
-                    for r in server.resources
-                )
-                new_enabled = not all_enabled
+                elif category == "resources":
+                    if server_key not in self.config.enabled_resources:
+                        self.config.enabled_resources[server_key] = set()
 
-                if server_key not in self.config.enabled_resources:
-                    self.config.enabled_resources[server_key] = set()
+                    resource_ids = {r.uri for r in server.resources}
+                    enabled_set = self.config.enabled_resources[server_key]
+                    new_enabled = not resource_ids <= enabled_set
 
-                for resource in server.resources:
+                    # Apply the whole category with one set operation
                     if new_enabled:
-                        self.config.enabled_resources[server_key].add(resource.uri)
+                        enabled_set |= resource_ids
                     else:
-                        self.config.enabled_resources[server_key].discard(resource.uri)
+                        enabled_set -= resource_ids
 
-                # Update child nodes
-                for child in node.children:
-                    self._update_node_label(child, new_enabled)
+                    # Update child nodes
+                    for child in node.children:
+                        self._update_node_label(child, new_enabled)
 
-            elif category == "prompts":
-                all_enabled = all(
-                    self.config.is_prompt_enabled(config_path, server_name, p.name)
-                    for p in server.prompts
-                )
-                new_enabled = not all_enabled
+                elif category == "prompts":
+                    if server_key not in self.config.enabled_prompts:
+                        self.config.enabled_prompts[server_key] = set()
 
-                if server_key not in self.config.enabled_prompts:
-                    self.config.enabled_prompts[server_key] = set()
+                    prompt_ids = {p.name for p in server.prompts}
+                    enabled_set = self.config.enabled_prompts[server_key]
+                    new_enabled = not prompt_ids <= enabled_set
 
-                for prompt in server.prompts:
+                    # Apply the whole category with one set operation
                     if new_enabled:
-                        self.config.enabled_prompts[server_key].add(prompt.name)
+                        enabled_set |= prompt_ids
                     else:
-                        self.config.enabled_prompts[server_key].discard(prompt.name)
-
-                # Update child nodes
-                for child in node.children:
-                    self._update_node_label(child, new_enabled)
-
-            # Update category label with x/y counter
-            enabled_count = len(node.children) if new_enabled else 0
-            button_text = (
-                "[bold red][Disable All][/bold red]"
-                if new_enabled
-                else "[bold green][Enable All][/bold green]"
-            )
-            node.set_label(
-                f"{category.title()} ({enabled_count}/{len(node.children)}) {button_text}"
-            )
+                        enabled_set -= prompt_ids
+
+                    # Update child nodes
+                    for child in node.children:
+                        self._update_node_label(child, new_enabled)
+
+                # Update category label with x/y counter
+                enabled_count = len(node.children) if new_enabled else 0
+                button_text = self._DISABLE_ALL if new_enabled else self._ENABLE_ALL
+                node.set_label(
+                    f"{category.title()} ({enabled_count}/{len(node.children)}) {button_text}"
+                )
 
             # Auto-save configuration
             self._auto_save_config()
@@ -615,11 +623,11 @@ class ProxyConfigScreen(Screen[None]):
             ):
                 return
 
-            server_key = self.config.make_server_key(config_path, server_name)
+            server_key = node.data["server_key"]
             if server_key not in self.config.enabled_tools:
                 self.config.enabled_tools[server_key] = set()
 
-            tool_enabled = self.config.is_tool_enabled(config_path, server_name, tool_name)
+            tool_enabled = tool_name in self.config.enabled_tools[server_key]
             if tool_enabled:
                 self.config.enabled_tools[server_key].discard(tool_name)
             else:
@@ -643,13 +651,11 @@ class ProxyConfigScreen(Screen[None]):
             ):
                 return
 
-            server_key = self.config.make_server_key(config_path, server_name)
+            server_key = node.data["server_key"]
             if server_key not in self.config.enabled_resources:
                 self.config.enabled_resources[server_key] = set()
 
-            resource_enabled = self.config.is_resource_enabled(
-                config_path, server_name, resource_uri
-            )
+            resource_enabled = resource_uri in self.config.enabled_resources[server_key]
             if resource_enabled:
                 self.config.enabled_resources[server_key].discard(resource_uri)
             else:
@@ -673,11 +679,11 @@ class ProxyConfigScreen(Screen[None]):
             ):
                 return
 
-            server_key = self.config.make_server_key(config_path, server_name)
+            server_key = node.data["server_key"]
             if server_key not in self.config.enabled_prompts:
                 self.config.enabled_prompts[server_key] = set()
 
-            prompt_enabled = self.config.is_prompt_enabled(config_path, server_name, prompt_name)
+            prompt_enabled = prompt_name in self.config.enabled_prompts[server_key]
             if prompt_enabled:
                 self.config.enabled_prompts[server_key].discard(prompt_name)
             else:
@@ -690,12 +696,30 @@ class ProxyConfigScreen(Screen[None]):
             self._auto_save_config()
 
     def _auto_save_config(self) -> None:
-        """Automatically save configuration after changes."""
+        """Schedule a debounced save so bursts of changes hit the disk once."""
+        if self._save_task and not self._save_task.done():
+            self._save_task.cancel()
+        self._save_task = asyncio.create_task(self._delayed_save())
+
+    async def _delayed_save(self) -> None:
+        """Save configuration once no further changes arrive within the debounce window."""
+        await asyncio.sleep(self.SAVE_DEBOUNCE_SECONDS)
+        self._save_config()
+
+    def _save_config(self) -> None:
+        """Save configuration, reporting failures as a notification."""
         try:
             self.config.save()
         except Exception as e:
             self.app.notify(f"Error auto-saving configuration: {e}", severity="error")
 
+    def on_unmount(self) -> None:
+        """Flush a pending debounced save so changes made just before leaving aren't lost."""
+        if self._save_task and not self._save_task.done():
+            self._save_task.cancel()
+            self._save_task = None
+            self._save_config()
+
     def _update_node_label(self, node: TreeNode[dict[str, Any]], enabled: bool) -> None:
         """Update a node's checkbox in its label.
 
@@ -703,53 +727,48 @@ class ProxyConfigScreen(Screen[None]):
             node: Tree node to update
             enabled: Whether the item is enabled
         """
-        label = str(node.label)
-
-        # Remove Rich markup tags if present
-        label = label.replace("[bold green]", "").replace("[/bold green]", "")
-        label = label.replace("[dim]", "").replace("[/dim]", "")
-
-        # Remove existing checkbox
-        if label.startswith("☑ ") or label.startswith("☐ "):
-            label = label[2:]
+        # Skip nodes already showing this state to avoid redundant repaints
+        if not node.data or node.data.get("enabled") is enabled:
+            return
+        node.data["enabled"] = enabled
 
-        # Add new checkbox
+        # Rebuild from the display name stored at creation instead of parsing the label
         checkbox = "☑" if enabled else "☐"
-        new_label = f"{checkbox} {label}"
+        new_label = f"{checkbox} {node.data['display']}"
 
         # Apply Rich markup formatting
         node.set_label(self._format_label(new_label, enabled))
 
     def _update_tree_branch(self, node: TreeNode[dict[str, Any]], enabled: bool) -> None:
-        """Recursively update all child nodes in a tree branch.
+        """Update all descendant nodes in a tree branch.
 
         Args:
             node: Parent tree node
             enabled: Whether items should be enabled
         """
-        for child in node.children:
-            child_type = child.data.get("type") if child.data else None
-
-            if child_type == "category":
-                # Update category button with x/y counter
-                category = child.data.get("category", "")
-                enabled_count = len(child.children) if enabled else 0
-                button_text = (
-                    "[bold red][Disable All][/bold red]"
-                    if enabled
-                    else "[bold green][Enable All][/bold green]"
-                )
-                child.set_label(
-                    f"{category.title()} ({enabled_count}/{len(child.children)}) {button_text}"
-                )
-                # Recursively update category children
-                self._update_tree_branch(child, enabled)
-            elif child_type in ["tool", "resource", "prompt"]:
-                # Update individual item checkbox
-                self._update_node_label(child, enabled)
-            else:
-                # Recursively update any other children (like server nodes)
-                self._update_tree_branch(child, enabled)
+        # Iterative depth-first walk with an explicit stack instead of recursion
+        stack: deque[TreeNode[dict[str, Any]]] = deque([node])
+        while stack:
+            parent = stack.pop()
+            for child in parent.children:
+                child_type = child.data.get("type") if child.data else None
+
+                if child_type in ("tool", "resource", "prompt"):
+                    # Update individual item checkbox
+                    self._update_node_label(child, enabled)
+                    continue
+
+                if child_type == "category":
+                    # Update category button with x/y counter
+                    category = child.data.get("category", "")
+                    enabled_count = len(child.children) if enabled else 0
+                    button_text = self._DISABLE_ALL if enabled else self._ENABLE_ALL
+                    child.set_label(
+                        f"{category.title()} ({enabled_count}/{len(child.children)}) {button_text}"
+                    )
+
+                # Descend into categories and any other children (like server nodes)
+                stack.append(child)
 
     def action_go_back(self) -> None:
         """Go back to previous screen."""
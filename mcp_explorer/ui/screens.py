@@ -1,17 +1,20 @@
 """Screens for MCP Explorer TUI."""
 
-from typing import Optional
+from typing import ClassVar, Optional
 
-from rich.text import Text
+from rich.text import Span, Text
 from textual import on
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal, Vertical, VerticalScroll
+from textual.message import Message
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widgets import (
     Button,
     Footer,
     Header,
     Label,
+    ListItem,
     ListView,
     ProgressBar,
     Static,
@@ -20,6 +23,7 @@ from textual.widgets import (
 )
 
 from ..models import MCPPrompt, MCPServer, MCPTool, MCPResource, ConfigFile
+from .dialogs import PromptPreviewDialog
 from .widgets import (
     ConfigFileHeader,
     DetailPanel,
@@ -165,6 +169,10 @@ class ServerDetailScreen(Screen):
         super().__init__()
         self.server = server
 
+        # Resolve display strings once; compose may run again on recompose
+        self._args_joined = " ".join(server.args) if server.args else ""
+        self._populated_tabs: set[str] = set()
+
     def compose(self) -> ComposeResult:
         """Compose the server detail screen."""
         yield Header(show_clock=True)
@@ -208,21 +216,21 @@ class ServerDetailScreen(Screen):
                         if self.server.command:
                             yield Static("Command", classes="info-label")
                             yield Static(self.server.command, classes="info-value-mono")
-                            if self.server.args:
+                            if self._args_joined:
                                 yield Static("Arguments", classes="info-label")
-                                yield Static(" ".join(self.server.args), classes="info-value-mono")
+                                yield Static(self._args_joined, classes="info-value-mono")
                         if self.server.url:
                             yield Static("URL", classes="info-label")
                             yield Static(self.server.url, classes="info-value-mono")
 
                 # Server Info Section
-                if self.server.server_info:
+                info_rows = self.server.get_server_info_display()
+                if info_rows:
                     yield Static("SERVER INFO", classes="info-section-header")
                     with Container(classes="info-section"):
-                        for key, value in self.server.server_info.items():
-                            if value:
-                                yield Static(key.title(), classes="info-label")
-                                yield Static(str(value), classes="info-value")
+                        for label, value in info_rows:
+                            yield Static(label, classes="info-label")
+                            yield Static(value, classes="info-value")
 
                 # Configuration Section
                 if self.server.source_file:
@@ -231,35 +239,54 @@ class ServerDetailScreen(Screen):
                         yield Static("Source File", classes="info-label")
                         yield Static(self.server.source_file, classes="info-value-mono")
 
-            # Capabilities tabs
+            # Capabilities tabs; lists are mounted when their tab is first shown
             with TabbedContent(id="capability-tabs"):
                 with TabPane("Tools", id="tools-tab"):
-                    if self.server.tools:
-                        yield ListView(
-                            *[ToolListItem(tool) for tool in self.server.tools],
-                            classes="capability-list",
-                        )
-                    else:
+                    if not self.server.tools:
                         yield Static("No tools available", classes="empty-state")
 
                 with TabPane("Resources", id="resources-tab"):
-                    if self.server.resources:
-                        yield ListView(
-                            *[ResourceListItem(resource) for resource in self.server.resources],
-                            classes="capability-list",
-                        )
-                    else:
+                    if not self.server.resources:
                         yield Static("No resources available", classes="empty-state")
 
                 with TabPane("Prompts", id="prompts-tab"):
-                    if self.server.prompts:
-                        yield ListView(
-                            *[PromptListItem(prompt) for prompt in self.server.prompts],
-                            classes="capability-list",
-                        )
-                    else:
+                    if not self.server.prompts:
                         yield Static("No prompts available", classes="empty-state")
 
+    def on_mount(self) -> None:
+        """Populate the initially active capability tab."""
+        self._populate_tab(self.query_one("#capability-tabs", TabbedContent).active)
+
+    @on(TabbedContent.TabActivated, "#capability-tabs")
+    def handle_tab_activated(self, event: TabbedContent.TabActivated) -> None:
+        """Populate a capability tab the first time it is activated."""
+        if event.pane.id:
+            self._populate_tab(event.pane.id)
+
+    def _populate_tab(self, pane_id: str) -> None:
+        """Mount the capability list for a tab, once.
+
+        Args:
+            pane_id: ID of the tab pane to populate
+        """
+        if not pane_id or pane_id in self._populated_tabs:
+            return
+        self._populated_tabs.add(pane_id)
+
+        items: list[ListItem]
+        if pane_id == "tools-tab":
+            items = [ToolListItem(tool) for tool in self.server.tools]
+        elif pane_id == "resources-tab":
+            items = [ResourceListItem(resource) for resource in self.server.resources]
+        elif pane_id == "prompts-tab":
+            items = [PromptListItem(prompt) for prompt in self.server.prompts]
+        else:
+            return
+
+        if items:
+            pane = self.query_one(f"#{pane_id}", TabPane)
+            pane.mount(ListView(*items, classes="capability-list"))
+
     def action_go_back(self) -> None:
         """Go back to previous screen."""
         self.app.pop_screen()
@@ -330,13 +357,7 @@ class ToolDetailScreen(Screen):
             # Input schema section
             if self.tool.input_schema:
                 yield Static("INPUT SCHEMA", classes="detail-section-header")
-                import json
-
-                # Pretty-print JSON with 2-space indentation and sorted keys for readability
-                schema_text = json.dumps(
-                    self.tool.input_schema, indent=2, sort_keys=True, ensure_ascii=False
-                )
-                yield Static(schema_text, classes="detail-section-json")
+                yield Static(self.tool.get_schema_json(), classes="detail-section-json")
 
 
 class ResourceDetailScreen(Screen):
@@ -399,13 +420,9 @@ class PromptDetailScreen(Screen):
                 yield DetailPanel("Description", self.prompt.description, classes="detail-panel")
 
             if self.prompt.arguments:
-                args_text = "\n\n".join(
-                    f"• {arg.name}"
-                    + (f" - {arg.description}" if arg.description else "")
-                    + (" [REQUIRED]" if arg.required else " [optional]")
-                    for arg in self.prompt.arguments
+                yield DetailPanel(
+                    "Arguments", self.prompt.get_arguments_text(), classes="detail-panel"
                 )
-                yield DetailPanel("Arguments", args_text, classes="detail-panel")
 
             with Horizontal(id="preview-buttons"):
                 yield Button("Preview Prompt", id="preview-button", variant="primary")
@@ -413,8 +430,6 @@ class PromptDetailScreen(Screen):
     @on(Button.Pressed, "#preview-button")
     def action_preview(self) -> None:
         """Preview the prompt."""
-        from .dialogs import PromptPreviewDialog
-
         self.app.push_screen(PromptPreviewDialog(self.server, self.prompt))  # type: ignore
 
 
@@ -437,6 +452,9 @@ class LoadingScreen(Screen):
 class SplashScreen(Screen):
     """Animated splash screen with initialization progress."""
 
+    class AnimationFinished(Message):
+        """Posted each time the logo gradient completes a full cycle through the palette."""
+
     # ASCII art for MCP-EXPLORER (each line is a row of the logo)
     ASCII_LOGO = [
         "███╗   ███╗ ██████╗██████╗       ███████╗██╗  ██╗██████╗ ██╗      ██████╗ ██████╗ ███████╗██████╗ ",
@@ -461,40 +479,94 @@ class SplashScreen(Screen):
         "#6ba8c4",  # Ocean blue
     ]
 
+    # Rich style string for each palette color, formatted once
+    STYLES = [f"bold {color}" for color in COLORS]
+
+    # Colors advance every 3 characters for a smoother wave: (start, end, base color index)
+    # for each same-color run across the logo width, computed once at class load
+    _LOGO_WIDTH = max(len(row) for row in ASCII_LOGO)
+    _LOGO_RUNS = tuple((i, i + 3, i // 3) for i in range(0, _LOGO_WIDTH, 3))
+
     SPINNER_FRAMES = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
 
+    # Spinner frame plus separator, ready to prepend to the status message
+    SPINNER_PREFIXES = [f"{frame} " for frame in SPINNER_FRAMES]
+
+    # Animation frame interval in seconds (~7 FPS is smooth enough for both animations)
+    FRAME_INTERVAL = 0.15
+
+    # Slower interval used while the terminal is too narrow to show the whole logo
+    NARROW_FRAME_INTERVAL = 0.25
+
+    # Pre-rendered logo, one Text per color offset; shared by all instances
+    _LOGO_FRAMES: ClassVar[list[Text]] = []
+
     def __init__(self) -> None:
         """Initialize the splash screen."""
         super().__init__()
         self._color_offset = 0
         self._spinner_frame = 0
-        self._logo_animation_task = None
-        self._spinner_animation_task = None
-
-    def _generate_animated_logo(self) -> Text:
-        """Generate the ASCII art logo with animated gradient colors."""
+        self._status_message = "Initializing..."
+        self._progress_percent = 0
+        self._animation_timer: Timer | None = None
+        self._animation_speed = 1.0
+        self._frame_interval = self.FRAME_INTERVAL
+        self._logo_frames = self._get_logo_frames()
+
+        # Widget references, resolved once on mount
+        self._logo_widget: Static | None = None
+        self._status_widget: Static | None = None
+        self._progress_widget: ProgressBar | None = None
+        self._percent_widget: Static | None = None
+
+    @classmethod
+    def _get_logo_frames(cls) -> list[Text]:
+        """Get the logo rendered for every color offset, building it on first use."""
+        if not cls._LOGO_FRAMES:
+            cls._LOGO_FRAMES = [cls._build_logo_for_offset(o) for o in range(len(cls.COLORS))]
+        return cls._LOGO_FRAMES
+
+    @classmethod
+    def _build_logo_for_offset(cls, offset: int) -> Text:
+        """Build the ASCII art logo with the gradient shifted by the given offset."""
         result = Text()
 
-        for row in self.ASCII_LOGO:
-            row_text = Text()
-            # Apply colors to each character in the row
-            for i, char in enumerate(row):
-                # Create a smoother wave by using a larger step size
-                # This makes adjacent characters have more distinct colors
-                color_index = ((i // 3) + self._color_offset) % len(self.COLORS)
-                row_text.append(char, style=f"bold {self.COLORS[color_index]}")
-            result.append(row_text)
+        styles = cls.STYLES
+        num_styles = len(styles)
+
+        # Style for each run at this offset, shared by every row
+        run_styles = [
+            (start, end, styles[(base + offset) % num_styles])
+            for start, end, base in cls._LOGO_RUNS
+        ]
+
+        # One Text per row from the plain string plus precomputed spans, clipped to the row
+        for row in cls.ASCII_LOGO:
+            row_len = len(row)
+            spans = [
+                Span(start, min(end, row_len), style)
+                for start, end, style in run_styles
+                if start < row_len
+            ]
+            result.append_text(Text(row, spans=spans))
             result.append("\n")
 
         return result
 
+    def _generate_animated_logo(self) -> Text:
+        """Get the ASCII art logo for the current animation frame."""
+        return self._logo_frames[self._color_offset]
+
     def compose(self) -> ComposeResult:
         """Compose the splash screen."""
         with Container(id="splash-container"):
             yield Static(self._generate_animated_logo(), id="splash-logo")
             yield Static("Model Context Protocol Server Browser", id="splash-subtitle")
             yield Static("", id="splash-spacer")
-            yield Static("⠋ Initializing...", id="splash-status")
+            yield Static(
+                self.SPINNER_PREFIXES[self._spinner_frame] + self._status_message,
+                id="splash-status",
+            )
             with Container(id="splash-progress-container"):
                 yield ProgressBar(
                     total=100, show_eta=False, show_percentage=False, id="splash-progress"
@@ -502,57 +574,97 @@ class SplashScreen(Screen):
                 yield Static("0%", id="splash-progress-percent")
 
     def on_mount(self) -> None:
-        """Start animations when screen is mounted."""
-        # Start separate animation tasks that run independently
-        self._logo_animation_task = self.run_worker(self._animate_logo_loop, exclusive=False)
-        self._spinner_animation_task = self.run_worker(self._animate_spinner_loop, exclusive=False)
+        """Start the animation timer when screen is mounted."""
+        self._logo_widget = self.query_one("#splash-logo", Static)
+        self._status_widget = self.query_one("#splash-status", Static)
+        self._progress_widget = self.query_one("#splash-progress", ProgressBar)
+        self._percent_widget = self.query_one("#splash-progress-percent", Static)
+        self._animation_timer = self.set_interval(self._frame_interval, self._animate_tick)
 
     def on_unmount(self) -> None:
-        """Stop animations when screen is unmounted."""
-        # Tasks will be automatically cancelled when screen unmounts
-        pass
-
-    async def _animate_logo_loop(self) -> None:
-        """Continuously animate the logo colors in a separate async loop."""
-        import asyncio
-
-        while True:
-            try:
-                # Update color offset for the gradient effect
-                self._color_offset = (self._color_offset + 1) % len(self.COLORS)
-
-                # Generate new logo with updated colors
-                logo_widget = self.query_one("#splash-logo", Static)
-                logo_widget.renderable = self._generate_animated_logo()
-                logo_widget.refresh()
-
-                # Wait before next frame (10 FPS)
-                await asyncio.sleep(0.1)
-            except Exception:
-                # If widget query fails (screen closing), exit gracefully
-                break
-
-    async def _animate_spinner_loop(self) -> None:
-        """Continuously animate the spinner in a separate async loop."""
-        import asyncio
-
-        while True:
-            try:
-                # Update spinner frame
-                self._spinner_frame = (self._spinner_frame + 1) % len(self.SPINNER_FRAMES)
-
-                # Update the spinner without changing the message
-                status = self.query_one("#splash-status", Static)
-                current_text = status.renderable
-                if isinstance(current_text, str) and " " in current_text:
-                    message = current_text.split(" ", 1)[1]
-                    status.update(f"{self.SPINNER_FRAMES[self._spinner_frame]} {message}")
-
-                # Wait before next frame (10 FPS)
-                await asyncio.sleep(0.1)
-            except Exception:
-                # If widget query fails (screen closing), exit gracefully
-                break
+        """Stop the animation timer when screen is unmounted."""
+        if self._animation_timer is not None:
+            self._animation_timer.stop()
+            self._animation_timer = None
+
+        # Widgets are recomposed if the screen is mounted again
+        self._logo_widget = None
+        self._status_widget = None
+        self._progress_widget = None
+        self._percent_widget = None
+
+    def _animate_tick(self) -> None:
+        """Advance the logo gradient and the spinner together, one repaint per frame."""
+        logo_widget = self._logo_widget
+        status = self._status_widget
+        # Don't render frames while another screen covers the splash
+        if logo_widget is None or status is None or not self.is_current:
+            return
+
+        # Animate at a lower rate when the logo is clipped anyway
+        frame_interval = (
+            self.NARROW_FRAME_INTERVAL
+            if self.size.width < self._LOGO_WIDTH
+            else self.FRAME_INTERVAL
+        ) / self._animation_speed
+        if frame_interval != self._frame_interval:
+            self._set_frame_interval(frame_interval)
+
+        logo_frames = self._logo_frames
+        spinner_prefixes = self.SPINNER_PREFIXES
+        color_offset = (self._color_offset + 1) % len(logo_frames)
+        spinner_frame = (self._spinner_frame + 1) % len(spinner_prefixes)
+        self._color_offset = color_offset
+        self._spinner_frame = spinner_frame
+
+        # Update both widgets inside one batch so the compositor paints once
+        with self.app.batch_update():
+            logo_widget.update(logo_frames[color_offset])
+            status.update(spinner_prefixes[spinner_frame] + self._status_message)
+
+        if color_offset == 0:
+            self.post_message(self.AnimationFinished())
+
+    def _set_frame_interval(self, frame_interval: float) -> None:
+        """Change the animation frame interval, restarting the timer if it's running."""
+        self._frame_interval = frame_interval
+        if self._animation_timer is not None:
+            self._animation_timer.stop()
+            self._animation_timer = self.set_interval(frame_interval, self._animate_tick)
+
+    def set_animation_speed(self, multiplier: float) -> None:
+        """Scale the animation rate, e.g. 10 to animate ten times faster.
+
+        Args:
+            multiplier: Factor applied to the frame rate (must be positive)
+        """
+        if multiplier <= 0:
+            raise ValueError("Animation speed multiplier must be positive")
+        self._animation_speed = multiplier
+        self._set_frame_interval(self.FRAME_INTERVAL / multiplier)
+
+    def reset(self) -> None:
+        """Restore the initial status, progress and animation state, so the screen can be reused."""
+        self._color_offset = 0
+        self._spinner_frame = 0
+        self._status_message = "Initializing..."
+        self._progress_percent = 0
+        if self._animation_speed != 1.0:
+            self._animation_speed = 1.0
+            self._set_frame_interval(self.FRAME_INTERVAL)
+
+        if (
+            self._logo_widget is None
+            or self._status_widget is None
+            or self._progress_widget is None
+            or self._percent_widget is None
+        ):
+            return  # Not mounted yet; compose picks up the initial state
+
+        self._logo_widget.update(self._logo_frames[0])
+        self._status_widget.update(self.SPINNER_PREFIXES[0] + self._status_message)
+        self._progress_widget.update(progress=0)
+        self._percent_widget.update("0%")
 
     def update_status(self, message: str, progress: float = 0) -> None:
         """Update the status message and progress.
@@ -561,14 +673,21 @@ class SplashScreen(Screen):
             message: Status message to display
             progress: Progress value (0-100)
         """
-        status_label = self.query_one("#splash-status", Static)
-        status_label.update(f"{self.SPINNER_FRAMES[self._spinner_frame]} {message}")
-
-        progress_bar = self.query_one("#splash-progress", ProgressBar)
-        progress_bar.update(progress=progress)
+        progress_percent = int(progress)
+        if message == self._status_message and progress_percent == self._progress_percent:
+            return  # Nothing visible would change
+
+        self._status_message = message
+        if (
+            self._status_widget is None
+            or self._progress_widget is None
+            or self._percent_widget is None
+        ):
+            return  # Not mounted yet; compose picks up the stored message
+
+        self._progress_percent = progress_percent
+        self._status_widget.update(self.SPINNER_PREFIXES[self._spinner_frame] + message)
+        self._progress_widget.update(progress=progress)
 
         # Update percentage display
-        percent_label = self.query_one("#splash-progress-percent", Static)
-        percent_label.update(f"{int(progress)}%")
-
-        self.refresh()
+        self._percent_widget.update(f"{progress_percent}%")
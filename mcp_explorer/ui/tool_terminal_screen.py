@@ -1,11 +1,18 @@
 """Tool Terminal Screen - Chat-like UI for testing MCP server tools."""
 
+import asyncio
+import dataclasses
 import io
 import json
 import sys
-from contextlib import contextmanager
+import time
+from collections import deque
+from collections.abc import Callable, Mapping
+from contextlib import AsyncExitStack, contextmanager
 from datetime import datetime
-from typing import Any
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import Any, Literal, get_args, get_origin, get_type_hints
 
 from fastmcp import Client
 from fastmcp.client.elicitation import ElicitResult
@@ -14,27 +21,254 @@ from mcp.types import LoggingMessageNotificationParams
 from textual import on
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal, VerticalScroll
+from textual.css.query import NoMatches
 from textual.screen import Screen
 from textual.widgets import Button, Footer, Header, Input, Select, Static
 
-from ..models import MCPServer, MCPTool, ProxyConfig
+from ..models import MCPServer, MCPTool, ProxyConfig, ToolParameter
+
+
+def _dumps_json(value: Any) -> str:
+    """Serialize a value as 2-space indented JSON for display."""
+    return json.dumps(value, indent=2, ensure_ascii=False)
+
+
+def _loads_json(value: str) -> Any:
+    """Parse JSON typed by the user, raising json.JSONDecodeError on invalid input."""
+    return json.loads(value)
+
+
+async def _null_log_handler(params: LoggingMessageNotificationParams) -> None:
+    """Consume log messages from the server so they aren't printed to stdout.
+
+    A plain function rather than a screen method, so no bound method is created per log.
+    """
+    # To show logs in the TUI instead, pass a screen method as the client's log_handler
+    # that forwards them with _add_message("system", f"Log [{params.level}]: {params.data}")
+
+
+class _NullIO(io.TextIOBase):
+    """Text stream that discards everything written to it."""
+
+    def write(self, s: str) -> int:
+        """Discard the text, reporting it as written."""
+        return len(s)
+
+
+# Shared sink, so suppressing output allocates nothing per use
+_NULL_IO = _NullIO()
 
 
 @contextmanager
 def suppress_stdout_stderr():
     """Suppress stdout and stderr to prevent TUI glitches."""
-    new_out, new_err = io.StringIO(), io.StringIO()
     old_out, old_err = sys.stdout, sys.stderr
     try:
-        sys.stdout, sys.stderr = new_out, new_err
+        sys.stdout = sys.stderr = _NULL_IO
         yield
     finally:
         sys.stdout, sys.stderr = old_out, old_err
 
 
+# Queued in place of a value when the user declines or cancels an elicitation
+_ELICITATION_ABORTED = object()
+
+# Queued for an optional elicitation field left empty and without a default
+_FIELD_SKIPPED = object()
+
+# Largest flat dict response formatted as JSON directly on the event loop
+_INLINE_JSON_MAX_KEYS = 32
+
+# Input strings accepted as boolean true for tool parameters and single-value responses
+_TRUE_VALUES = frozenset({"true", "1", "yes"})
+
+# Elicitation form fields also accept the "y" shorthand
+_FIELD_TRUE_VALUES = _TRUE_VALUES | {"y"}
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean from user input."""
+    return value.lower() in _TRUE_VALUES
+
+
+def _parse_field_bool(value: str) -> bool:
+    """Parse a boolean elicitation field from user input."""
+    return value.lower() in _FIELD_TRUE_VALUES
+
+
+# Parsers for typed user input, keyed by JSON schema type; other types stay strings
+_TYPE_PARSERS: dict[str, Callable[[str], Any]] = {
+    "integer": int,
+    "number": float,
+    "boolean": _parse_bool,
+    "object": _loads_json,
+    "array": _loads_json,
+}
+
+# Parsers for elicitation form fields, differing only in the boolean shorthand
+_FIELD_TYPE_PARSERS: dict[str, Callable[[str], Any]] = {
+    **_TYPE_PARSERS,
+    "boolean": _parse_field_bool,
+}
+
+
+def _format_image_content(item: Any) -> str:
+    """Format an image content item as a placeholder."""
+    return f"[Image: {getattr(item, 'mimeType', 'unknown')}]"
+
+
+def _format_resource_content(item: Any) -> str:
+    """Format an embedded resource content item as a placeholder."""
+    resource = getattr(item, "resource", None)
+    if isinstance(resource, dict):
+        uri = resource.get("uri")
+    else:
+        # MCP content types carry the resource as a model with a uri attribute
+        uri = getattr(resource, "uri", None)
+    return f"[Resource: {uri or 'unknown'}]"
+
+
+# Formatters for non-text tool result content, keyed by content type
+_CONTENT_FORMATTERS: dict[str | None, Callable[[Any], str]] = {
+    "image": _format_image_content,
+    "resource": _format_resource_content,
+}
+
+
+def _passthrough_response(response: str) -> str:
+    """Return a response for a type without a dedicated coercer unchanged."""
+    return response
+
+
+def _build_dataclass_response(response_type: type, response: str) -> Any:
+    """Build a dataclass response from a JSON object typed by the user."""
+    return response_type(**_loads_json(response))
+
+
+# Coercers for single-value elicitation responses of primitive types
+_PRIMITIVE_COERCERS: dict[type, Callable[[str], Any]] = {
+    str: str,
+    int: int,
+    float: float,
+    bool: _parse_bool,
+}
+
+
+@lru_cache(maxsize=128)
+def _response_coercer(response_type: type) -> Callable[[str], Any]:
+    """Get the function converting user input into a response of the given type.
+
+    The returned coercer raises ValueError or TypeError when the input doesn't fit.
+
+    Args:
+        response_type: The expected elicitation response type
+
+    Returns:
+        Callable taking the raw response string
+    """
+    if hasattr(response_type, "__dataclass_fields__"):
+        return partial(_build_dataclass_response, response_type)
+    return _PRIMITIVE_COERCERS.get(response_type, _passthrough_response)
+
+
+# Maximum length of a tool's label in the tool select
+_TOOL_LABEL_MAX_LENGTH = 50
+
+
+def _tool_option_label(tool: MCPTool) -> str:
+    """Build a tool's select label as "name - description", cut to the maximum length."""
+    description = tool.description or "No description"
+    # Cut the description before formatting so long descriptions aren't copied in full
+    room = max(_TOOL_LABEL_MAX_LENGTH - len(tool.name) - 3, 0)
+    return f"{tool.name} - {description[:room]}"[:_TOOL_LABEL_MAX_LENGTH]
+
+
+# JSON schema type names for scalar annotations, given as types or as string annotations
+_SCALAR_TYPE_NAMES: dict[Any, str] = {
+    str: "string",
+    "str": "string",
+    int: "integer",
+    "int": "integer",
+    float: "number",
+    "float": "number",
+    bool: "boolean",
+    "bool": "boolean",
+}
+
+
+@lru_cache(maxsize=128)
+def _dataclass_schema_fields(response_type: type) -> tuple[Mapping[str, Any], ...]:
+    """Extract elicitation field descriptors from a dataclass response type.
+
+    FastMCP generates the same dataclass for repeated elicitations of one schema, so the
+    introspection (type hints, defaults) runs once per type. Default factories are kept
+    rather than called, so each elicitation gets a fresh default value.
+
+    Args:
+        response_type: The dataclass type created by FastMCP from JSON schema
+
+    Returns:
+        Tuple of read-only field mappings with name, type, required, default,
+        default_factory and enum values; the result is cached, so it must not be modified
+    """
+    fields: list[dict[str, Any]] = []
+
+    try:
+        type_hints = get_type_hints(response_type)
+    except Exception:
+        type_hints = {}
+
+    for field_name, field_obj in response_type.__dataclass_fields__.items():
+        field_type = type_hints.get(field_name, field_obj.type)
+
+        # Determine the type string and enum values
+        enum_values: list[Any] | None = None
+
+        # Plain scalar types map directly; otherwise check for Literal (enum-like) and Enum
+        type_str = _SCALAR_TYPE_NAMES.get(field_type)
+        if type_str is None:
+            if get_origin(field_type) is Literal:
+                enum_values = list(get_args(field_type))
+                type_str = "enum"
+            elif hasattr(field_type, "__members__"):  # Python Enum
+                enum_values = list(field_type.__members__.keys())
+                type_str = "enum"
+            else:
+                type_str = getattr(field_type, "__name__", str(field_type))
+
+        # Check if field has a default value
+        has_default = field_obj.default is not dataclasses.MISSING
+        has_default_factory = field_obj.default_factory is not dataclasses.MISSING
+        is_required = not (has_default or has_default_factory)
+
+        field_info: dict[str, Any] = {
+            "name": field_name,
+            "type": type_str,
+            "required": is_required,
+            "description": "",
+            "default": field_obj.default if has_default else None,
+            "default_factory": field_obj.default_factory if has_default_factory else None,
+        }
+
+        if enum_values:
+            field_info["enum"] = enum_values
+
+        fields.append(field_info)
+
+    return tuple(MappingProxyType(field_info) for field_info in fields)
+
+
 class ChatMessage(Static):
     """A single message in the chat interface."""
 
+    # Sender label shown under the timestamp for each message type
+    _SENDER_LABELS = {
+        "user": "❯ User",
+        "system": "⚙ System",
+        "result": "✓ Result",
+        "error": "✗ Error",
+    }
+
     def __init__(
         self,
         message_type: str,
@@ -47,27 +281,21 @@ class ChatMessage(Static):
             content: Message content
             timestamp: Message timestamp (defaults to now)
         """
-        super().__init__()
+        # Style the message itself rather than wrapping its children in another container
+        super().__init__(classes=f"chat-message chat-message-{message_type}")
         self.message_type = message_type
         self.content = content
         self.timestamp = timestamp or datetime.now()
+        # Labels are fixed for the message's lifetime; format them once, not per compose
+        self._time_str = self.timestamp.strftime("%H:%M:%S")
+        self._sender = self._SENDER_LABELS.get(message_type)
 
     def compose(self) -> ComposeResult:
         """Compose the chat message."""
-        # Format timestamp
-        time_str = self.timestamp.strftime("%H:%M:%S")
-        # Create styled message based on type
-        with Container(classes=f"chat-message chat-message-{self.message_type}"):
-            yield Static(time_str, classes="message-timestamp")
-            if self.message_type == "user":
-                yield Static("❯ User", classes="message-sender")
-            elif self.message_type == "system":
-                yield Static("⚙ System", classes="message-sender")
-            elif self.message_type == "result":
-                yield Static("✓ Result", classes="message-sender")
-            elif self.message_type == "error":
-                yield Static("✗ Error", classes="message-sender")
-            yield Static(self.content, classes="message-content")
+        yield Static(self._time_str, classes="message-timestamp")
+        if self._sender:
+            yield Static(self._sender, classes="message-sender")
+        yield Static(self.content, classes="message-content")
 
 
 class ToolTerminalScreen(Screen[None]):
@@ -80,6 +308,19 @@ class ToolTerminalScreen(Screen[None]):
         ("ctrl+j", "scroll_down", "Scroll Down"),
     ]
 
+    # Messages added within this window share a single scroll to the end
+    SCROLL_DEBOUNCE_SECONDS = 0.05
+
+    # Result and error messages longer than this jump to the end instead of animating
+    ANIMATED_SCROLL_MAX_CHARS = 1024
+
+    # Most elicitations kept for the execution summary of a single tool run
+    MAX_ELICITATION_HISTORY = 256
+
+    # Most messages kept in the chat; beyond it the oldest are removed in batches of this size
+    MAX_CHAT_MESSAGES = 500
+    CHAT_TRIM_COUNT = 50
+
     def __init__(self, servers: list[MCPServer], proxy_config: ProxyConfig) -> None:
         """Initialize the tool terminal screen.
         Args:
@@ -94,34 +335,60 @@ class ToolTerminalScreen(Screen[None]):
         self.tool_params: dict[str, Any] = {}
         self.current_param_index = 0
         self.enabled_servers = self._get_enabled_servers()
-        # Elicitation state
+        # Built in reverse so the first of any duplicate names wins, as a linear scan would
+        self._server_by_name = {s.name: s for s in reversed(self.enabled_servers)}
+        self._tool_by_name: dict[str, MCPTool] = {}
+        # Prompt text for each parameter of the selected tool, aligned with its parameters
+        self._param_prompts: list[str] = []
+        # Select options, built once: server options here, tool options on first selection
+        # _get_enabled_servers already drops servers without enabled tools
+        self._server_options = [
+            (f"{s.name} ({len(s.tools)} tools)", s.name) for s in self.enabled_servers
+        ]
+        self._tool_options_cache: dict[str, list[tuple[str, str]]] = {}
+        # Text last written to the tool info and input prompt widgets
+        self._last_tool_info = ""
+        self._last_input_prompt = ""
+        # Messages added since the last scroll to the end of the chat, and whether the
+        # latest one is small enough to scroll to with an animation
+        self._unscrolled_messages = 0
+        self._scroll_animated = True
+        # Messages mounted in the chat area, starting with the welcome message
+        self._message_count = 1
+        # Elicitation state; pending while waiting for a single free-form response
         self._elicitation_pending: bool = False
-        self._elicitation_response: Any | None = None
         self._elicitation_action: str = "accept"
-        self._elicitation_history: list[dict[str, Any]] = []
+        self._elicitation_history: deque[dict[str, Any]] = deque(
+            maxlen=self.MAX_ELICITATION_HISTORY
+        )
         # Elicitation field collection (like tool parameters)
         self._elicitation_fields: list[dict[str, Any]] = []
         self._elicitation_field_values: dict[str, Any] = {}
-        self._current_elicitation_field_index: int = 0
-        self._elicitation_collecting_fields: bool = False
+        self._elicitation_current_field: dict[str, Any] | None = None
+        # User input for the pending elicitation, consumed by _elicitation_handler
+        self._elicitation_queue: asyncio.Queue[Any] = asyncio.Queue()
+        # Running tool execution, kept so it can be cancelled
+        self._exec_task: asyncio.Task[None] | None = None
+        # Proxy client, connected on first execution and reused until the screen unmounts
+        self._client: Client | None = None
+        self._client_stack: AsyncExitStack | None = None
 
     def _get_enabled_servers(self) -> list[MCPServer]:
         """Get list of servers that are enabled in the proxy configuration."""
+        proxy_config = self.proxy_config
         enabled = []
         for server in self.servers:
             config_file_path = server.source_file or ""
-            if self.proxy_config.is_server_enabled(config_file_path, server.name):
-                enabled_tools = [
-                    tool
-                    for tool in server.tools
-                    if self.proxy_config.is_tool_enabled(config_file_path, server.name, tool.name)
-                ]
-                if enabled_tools:
-                    from copy import copy
-
-                    server_copy = copy(server)
-                    server_copy.tools = enabled_tools
-                    enabled.append(server_copy)
+            if not proxy_config.is_server_enabled(config_file_path, server.name):
+                continue
+            # Resolve the server's enabled tool set once instead of per tool
+            tool_names = proxy_config.get_enabled_tool_names(config_file_path, server.name)
+            if not tool_names:
+                continue
+            enabled_tools = [tool for tool in server.tools if tool.name in tool_names]
+            if enabled_tools:
+                # Shallow copy: only the tools list differs from the original server
+                enabled.append(server.model_copy(update={"tools": enabled_tools}))
         return enabled
 
     def compose(self) -> ComposeResult:
@@ -132,11 +399,7 @@ class ToolTerminalScreen(Screen[None]):
             with Container(id="terminal-control-panel"):
                 yield Static("Tool Terminal", classes="terminal-title")
                 with Horizontal(id="terminal-selectors"):
-                    server_options = [
-                        (f"{s.name} ({len(s.tools)} tools)", s.name)
-                        for s in self.enabled_servers
-                        if s.tools
-                    ]
+                    server_options = self._server_options
                     if server_options:
                         yield Select(
                             options=server_options,
@@ -176,14 +439,23 @@ class ToolTerminalScreen(Screen[None]):
 
     def on_mount(self) -> None:
         """Set up initial state when screen is mounted."""
-        # Only try to focus server select if it exists (when there are enabled servers)
+        # Resolve widgets once; handlers below run for every message and keystroke
+        self._tool_select = self.query_one("#tool-select", Select)
+        self._tool_info = self.query_one("#tool-info", Static)
+        self._chat_area = self.query_one("#chat-area", VerticalScroll)
+        self._input_prompt = self.query_one("#input-prompt", Static)
+        self._terminal_input = self.query_one("#terminal-input", Input)
+        self._send_btn = self.query_one("#send-btn", Button)
+        self._execute_btn = self.query_one("#execute-btn", Button)
+
+        # Server select only exists when there are enabled servers
         try:
-            server_select = self.query_one("#server-select", Select)
-            if server_select:
-                self.call_after_refresh(lambda: server_select.focus())
-        except Exception:
-            # No server select widget (no enabled servers), that's ok
-            pass
+            self._server_select: Select | None = self.query_one("#server-select", Select)
+        except NoMatches:
+            self._server_select = None
+
+        if self._server_select is not None:
+            self.call_after_refresh(self._server_select.focus)
 
     @on(Select.Changed, "#server-select")
     def handle_server_change(self, event: Select.Changed) -> None:
@@ -191,16 +463,15 @@ class ToolTerminalScreen(Screen[None]):
         if event.value == Select.BLANK:
             return
         server_name = str(event.value)
-        self.selected_server = next(
-            (s for s in self.enabled_servers if s.name == server_name), None
-        )
+        self.selected_server = self._server_by_name.get(server_name)
         if not self.selected_server:
             return
-        tool_select = self.query_one("#tool-select", Select)
-        tool_options = [
-            (f"{t.name} - {t.description or 'No description'}"[:50], t.name)
-            for t in self.selected_server.tools
-        ]
+        self._tool_by_name = {t.name: t for t in reversed(self.selected_server.tools)}
+        tool_select = self._tool_select
+        tool_options = self._tool_options_cache.get(server_name)
+        if tool_options is None:
+            tool_options = [(_tool_option_label(t), t.name) for t in self.selected_server.tools]
+            self._tool_options_cache[server_name] = tool_options
         tool_select.set_options(tool_options)
         self._add_message(
             "system",
@@ -220,11 +491,12 @@ class ToolTerminalScreen(Screen[None]):
         if event.value == Select.BLANK or not self.selected_server:
             return
         tool_name = str(event.value)
-        self.selected_tool = next(
-            (t for t in self.selected_server.tools if t.name == tool_name), None
-        )
+        self.selected_tool = self._tool_by_name.get(tool_name)
         if not self.selected_tool:
             return
+        self._param_prompts = [
+            self._build_param_prompt(param) for param in self.selected_tool.parameters
+        ]
         self.tool_params = {}
         self.current_param_index = 0
         self._update_tool_info()
@@ -238,12 +510,11 @@ class ToolTerminalScreen(Screen[None]):
             self._prompt_next_parameter()
         else:
             self._set_input_prompt("Tool has no parameters. Click 'Execute' to run.")
-            execute_btn = self.query_one("#execute-btn", Button)
-            execute_btn.focus()
+            self._execute_btn.focus()
 
     def _update_tool_info(self) -> None:
         """Update the tool info display."""
-        tool_info = self.query_one("#tool-info", Static)
+        info_text = ""
         if self.selected_tool:
             info_text = f"Tool: {self.selected_tool.name}"
             if self.selected_tool.parameters:
@@ -252,61 +523,74 @@ class ToolTerminalScreen(Screen[None]):
                 info_text += f" | Params: {required} required, {optional} optional"
             else:
                 info_text += " | No parameters"
-            tool_info.update(info_text)
-        else:
-            tool_info.update("")
+        if info_text == self._last_tool_info:
+            return  # Already showing this text
+        self._last_tool_info = info_text
+        self._tool_info.update(info_text)
 
     def _prompt_next_parameter(self) -> None:
         """Prompt for the next parameter value."""
         if not self.selected_tool or self.current_param_index >= len(self.selected_tool.parameters):
             self._set_input_prompt("All parameters collected. Click 'Execute' to run.")
             return
-        param = self.selected_tool.parameters[self.current_param_index]
+        prompt_text = self._param_prompts[self.current_param_index]
+        # Prompt line and chat message change together; repaint them once
+        with self.app.batch_update():
+            self._set_input_prompt(prompt_text)
+            self._add_message("system", prompt_text)
+        self._terminal_input.focus()
+
+    @staticmethod
+    def _build_param_prompt(param: ToolParameter) -> str:
+        """Build the input prompt for a tool parameter."""
         required_text = "[REQUIRED]" if param.required else "[optional]"
         prompt_text = f"Enter {param.name} ({param.type}) {required_text}"
         if param.description:
             prompt_text += f"\n{param.description}"
-        self._set_input_prompt(prompt_text)
-        self._add_message("system", prompt_text)
-        terminal_input = self.query_one("#terminal-input", Input)
-        terminal_input.focus()
+        return prompt_text
 
-    def _prompt_next_elicitation_field(self) -> None:
-        """Prompt for the next elicitation field value.
+    @staticmethod
+    def _build_elicitation_field_prompt(field: dict[str, Any]) -> str:
+        """Build the input prompt for an elicitation field."""
+        required_text = "[REQUIRED]" if field.get("required", True) else "[optional]"
+        prompt_text = f"🔔 Enter {field['name']} ({field.get('type', 'string')}) {required_text}"
 
-        Similar to _prompt_next_parameter but for elicitation schema fields.
-        When all fields are collected, sets _elicitation_collecting_fields to False.
-        """
-        if self._current_elicitation_field_index >= len(self._elicitation_fields):
-            # All fields collected
-            self._elicitation_collecting_fields = False
-            self._elicitation_pending = False
-            return
-
-        field = self._elicitation_fields[self._current_elicitation_field_index]
-        field_name = field["name"]
-        field_type = field.get("type", "string")
-        field_required = field.get("required", True)
         field_description = field.get("description", "")
         field_default = field.get("default")
         field_enum = field.get("enum")
-
-        required_text = "[REQUIRED]" if field_required else "[optional]"
-        prompt_text = f"🔔 Enter {field_name} ({field_type}) {required_text}"
-
         if field_description:
             prompt_text += f"\n   {field_description}"
         if field_default is not None:
             prompt_text += f"\n   Default: {field_default}"
         if field_enum:
             prompt_text += f"\n   Options: {', '.join(str(e) for e in field_enum)}"
+        return prompt_text
 
-        self._set_input_prompt(prompt_text)
-        self._add_message("system", prompt_text)
+    def _prompt_elicitation_field(self, field: dict[str, Any]) -> None:
+        """Prompt for an elicitation field value.
+
+        Similar to _prompt_next_parameter but for elicitation schema fields. The value
+        submitted for the field is queued for the waiting elicitation handler.
+        """
+        self._elicitation_current_field = field
+        prompt_text = field["prompt"]
+        # Prompt line and chat message change together; repaint them once
+        with self.app.batch_update():
+            self._set_input_prompt(prompt_text)
+            self._add_message("system", prompt_text)
 
         # Focus the input
-        terminal_input = self.query_one("#terminal-input", Input)
-        terminal_input.focus()
+        self._terminal_input.focus()
+
+    def _submit_elicitation_input(self, value: Any) -> None:
+        """Hand user input to the waiting elicitation handler and stop accepting more.
+
+        Args:
+            value: Parsed input, or a sentinel for a skipped field or an aborted request
+        """
+        self._elicitation_current_field = None
+        self._elicitation_pending = False
+        self._elicitation_queue.put_nowait(value)
 
     def _parse_elicitation_schema(
         self, response_type: type | None, params: Any
@@ -323,73 +607,24 @@ class ToolTerminalScreen(Screen[None]):
         Returns:
             List of field dictionaries with name, type, required, description, etc.
         """
-        import dataclasses
-        from typing import Literal, get_args, get_origin, get_type_hints
-
         fields: list[dict[str, Any]] = []
 
         # If response_type is None, no fields needed (acknowledgment only)
         if response_type is None:
             return fields
 
-        # Try to get fields from the dataclass
+        # Try to get fields from the dataclass; the cached descriptors are read-only, so
+        # copy them into dicts the caller can extend
         if hasattr(response_type, "__dataclass_fields__"):
-            try:
-                type_hints = get_type_hints(response_type)
-            except Exception:
-                type_hints = {}
-
-            for field_name, field_obj in response_type.__dataclass_fields__.items():
-                field_type = type_hints.get(field_name, field_obj.type)
-
-                # Determine the type string and enum values
-                type_str = "string"
-                enum_values: list[Any] | None = None
-
-                # Check for Literal type (enum-like)
-                origin = get_origin(field_type)
-                if origin is Literal:
-                    enum_values = list(get_args(field_type))
-                    type_str = "enum"
-                elif field_type is str or field_type == "str":
-                    type_str = "string"
-                elif field_type is int or field_type == "int":
-                    type_str = "integer"
-                elif field_type is float or field_type == "float":
-                    type_str = "number"
-                elif field_type is bool or field_type == "bool":
-                    type_str = "boolean"
-                elif hasattr(field_type, "__members__"):  # Python Enum
-                    enum_values = list(field_type.__members__.keys())
-                    type_str = "enum"
-                else:
-                    type_str = getattr(field_type, "__name__", str(field_type))
-
-                # Check if field has a default value
-                has_default = field_obj.default is not dataclasses.MISSING
-                has_default_factory = field_obj.default_factory is not dataclasses.MISSING
-                is_required = not (has_default or has_default_factory)
-
-                default_value = None
-                if has_default:
-                    default_value = field_obj.default
-                elif has_default_factory:
+            for cached_field in _dataclass_schema_fields(response_type):
+                field_info = dict(cached_field)
+                # Build factory defaults per elicitation, so no mutable default is shared
+                default_factory = field_info.pop("default_factory")
+                if default_factory is not None:
                     try:
-                        default_value = field_obj.default_factory()
+                        field_info["default"] = default_factory()
                     except Exception:
                         pass
-
-                field_info: dict[str, Any] = {
-                    "name": field_name,
-                    "type": type_str,
-                    "required": is_required,
-                    "description": "",
-                    "default": default_value,
-                }
-
-                if enum_values:
-                    field_info["enum"] = enum_values
-
                 fields.append(field_info)
 
         # Fallback: try to get fields from params.requestedSchema if no dataclass fields
@@ -417,6 +652,14 @@ class ToolTerminalScreen(Screen[None]):
 
                     fields.append(field_info)
 
+        # Build each field's prompt and overview line once, up front
+        for field_info in fields:
+            field_info["prompt"] = self._build_elicitation_field_prompt(field_info)
+            required_text = "[required]" if field_info.get("required", True) else "[optional]"
+            field_info["summary"] = (
+                f"  • {field_info['name']} ({field_info.get('type', 'string')}) {required_text}"
+            )
+
         return fields
 
     def _parse_elicitation_field_value(self, field: dict[str, Any], value: str) -> Any:
@@ -429,57 +672,61 @@ class ToolTerminalScreen(Screen[None]):
         Returns:
             Parsed value in appropriate type
         """
-        field_type = field.get("type", "string")
-
-        if field_type == "integer":
-            return int(value)
-        elif field_type == "number":
-            return float(value)
-        elif field_type == "boolean":
-            return value.lower() in ["true", "1", "yes", "y"]
-        elif field_type in ["object", "array"]:
-            return json.loads(value)
-        else:
-            # Default to string
-            return value
+        parser = _FIELD_TYPE_PARSERS.get(field.get("type", "string"))
+        return parser(value) if parser else value
 
     def _set_input_prompt(self, text: str) -> None:
         """Set the input prompt text."""
-        prompt = self.query_one("#input-prompt", Static)
-        prompt.update(text)
+        if text == self._last_input_prompt:
+            return  # Already showing this text
+        self._last_input_prompt = text
+        self._input_prompt.update(text)
 
     def _add_message(self, message_type: str, content: str) -> None:
         """Add a message to the chat area."""
-        chat_area = self.query_one("#chat-area", VerticalScroll)
-        message = ChatMessage(message_type, content)
-        chat_area.mount(message)
-        self.call_after_refresh(lambda: chat_area.scroll_end(animate=True))
+        chat_area = self._chat_area
+        chat_area.mount(ChatMessage(message_type, content))
+        self._message_count += 1
+        if self._message_count > self.MAX_CHAT_MESSAGES:
+            # Drop the oldest messages so layout cost stays bounded in long sessions
+            chat_area.remove_children(chat_area.children[: self.CHAT_TRIM_COUNT])
+            self._message_count -= self.CHAT_TRIM_COUNT
+        self._scroll_animated = (
+            message_type not in ("result", "error")
+            or len(content) <= self.ANIMATED_SCROLL_MAX_CHARS
+        )
+        self._unscrolled_messages += 1
+        if self._unscrolled_messages == 1:
+            self.set_timer(self.SCROLL_DEBOUNCE_SECONDS, self._flush_scroll)
+
+    def _flush_scroll(self) -> None:
+        """Scroll the chat to the newest message, once per burst of messages."""
+        # Only animate a lone, small message; bursts and big payloads jump to the end
+        animate = self._unscrolled_messages == 1 and self._scroll_animated
+        self._unscrolled_messages = 0
+        self._chat_area.scroll_end(animate=animate)
 
     def _format_tool_result(self, result: Any) -> str:
         """Format a tool result for display, handling MCP protocol response format."""
-        if hasattr(result, "content"):
-            result_parts = []
-            for item in result.content:
-                if hasattr(item, "text"):
-                    result_parts.append(item.text)
-                elif hasattr(item, "type"):
-                    if item.type == "text" and hasattr(item, "text"):
-                        result_parts.append(item.text)
-                    elif item.type == "image" and hasattr(item, "data"):
-                        result_parts.append(f"[Image: {getattr(item, 'mimeType', 'unknown')}]")
-                    elif item.type == "resource" and hasattr(item, "resource"):
-                        result_parts.append(f"[Resource: {item.resource.get('uri', 'unknown')}]")
-                    else:
-                        result_parts.append(str(item))
-                else:
-                    result_parts.append(str(item))
+        content = getattr(result, "content", None)
+        if content is not None:
+            result_parts: list[str] = []
+            append = result_parts.append
+            for item in content:
+                # Text is by far the most common content; check it with a single lookup
+                text = getattr(item, "text", None)
+                if text is not None:
+                    append(text)
+                    continue
+                formatter = _CONTENT_FORMATTERS.get(getattr(item, "type", None))
+                append(formatter(item) if formatter else str(item))
             return "\n".join(result_parts) if result_parts else str(result)
         elif isinstance(result, (dict, list)):
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            return _dumps_json(result)
         else:
             return str(result)
 
-    def _format_execution_summary(self, result: Any) -> str:
+    async def _format_execution_summary(self, result: Any) -> str:
         """Format a complete execution summary including elicitations and final result.
 
         Args:
@@ -502,7 +749,13 @@ class ToolTerminalScreen(Screen[None]):
                     response_value = elicitation["response"]
                     # Format the response value nicely
                     if isinstance(response_value, dict):
-                        response_str = json.dumps(response_value, indent=2)
+                        # Encode big or nested responses off the event loop to keep the UI live
+                        if len(response_value) > _INLINE_JSON_MAX_KEYS or any(
+                            isinstance(value, (dict, list)) for value in response_value.values()
+                        ):
+                            response_str = await asyncio.to_thread(_dumps_json, response_value)
+                        else:
+                            response_str = _dumps_json(response_value)
                     else:
                         response_str = str(response_value)
                     parts.append(f"   ✓ Response: {response_str} (accepted)")
@@ -524,78 +777,64 @@ class ToolTerminalScreen(Screen[None]):
     @on(Input.Submitted, "#terminal-input")
     async def handle_send(self, event: Button.Pressed | Input.Submitted) -> None:
         """Handle sending input (collecting parameter values or elicitation responses)."""
-        terminal_input = self.query_one("#terminal-input", Input)
+        terminal_input = self._terminal_input
         value = terminal_input.value.strip()
 
         # Handle elicitation field collection (multi-field form)
-        if self._elicitation_collecting_fields:
+        field = self._elicitation_current_field
+        if field is not None:
             # Check for special commands first
             if value.lower() == "decline":
                 self._add_message("user", "Declining elicitation request")
                 self._elicitation_action = "decline"
-                self._elicitation_collecting_fields = False
-                self._elicitation_pending = False
+                self._submit_elicitation_input(_ELICITATION_ABORTED)
                 terminal_input.value = ""
                 return
             elif value.lower() == "cancel":
                 self._add_message("user", "Cancelling elicitation request")
                 self._elicitation_action = "cancel"
-                self._elicitation_collecting_fields = False
-                self._elicitation_pending = False
+                self._submit_elicitation_input(_ELICITATION_ABORTED)
                 terminal_input.value = ""
                 return
 
-            # Handle current field
-            if self._current_elicitation_field_index < len(self._elicitation_fields):
-                field = self._elicitation_fields[self._current_elicitation_field_index]
-                field_name = field["name"]
-                field_required = field.get("required", True)
-
-                # Handle empty value for optional fields
-                if not value:
-                    if not field_required:
-                        # Use default or skip
-                        if field.get("default") is not None:
-                            self._elicitation_field_values[field_name] = field["default"]
-                            self._add_message(
-                                "user", f"{field_name} = {field['default']} (default)"
-                            )
-                        else:
-                            self._add_message("user", f"Skipping optional field: {field_name}")
-                        self._current_elicitation_field_index += 1
-                        terminal_input.value = ""
-                        self._prompt_next_elicitation_field()
-                        return
-                    else:
-                        # Required field, don't allow empty
-                        return
+            field_name = field["name"]
 
-                # Parse and store the value
-                try:
-                    parsed_value = self._parse_elicitation_field_value(field, value)
-
-                    # Validate enum/const constraints
-                    if "enum" in field and parsed_value not in field["enum"]:
-                        valid_options = ", ".join(str(e) for e in field["enum"])
-                        self._add_message(
-                            "error",
-                            f"Invalid value. Must be one of: {valid_options}",
-                        )
-                        return
-                    if "const" in field and parsed_value != field["const"]:
-                        self._add_message("error", f"Value must be: {field['const']}")
-                        return
-
-                    self._elicitation_field_values[field_name] = parsed_value
-                    self._add_message("user", f"{field_name} = {value}")
-                    self._current_elicitation_field_index += 1
+            # Handle empty value for optional fields
+            if not value:
+                if not field.get("required", True):
+                    # Use default or skip
+                    if field.get("default") is not None:
+                        self._add_message("user", f"{field_name} = {field['default']} (default)")
+                        self._submit_elicitation_input(field["default"])
+                    else:
+                        self._add_message("user", f"Skipping optional field: {field_name}")
+                        self._submit_elicitation_input(_FIELD_SKIPPED)
                     terminal_input.value = ""
-                    self._prompt_next_elicitation_field()
+                # Required fields can't be left empty
+                return
 
-                except (ValueError, json.JSONDecodeError) as e:
-                    self._add_message("error", f"Invalid value for {field_name}: {e}")
-                    return
+            # Parse and validate the value
+            try:
+                parsed_value = self._parse_elicitation_field_value(field, value)
+            except (ValueError, json.JSONDecodeError) as e:
+                self._add_message("error", f"Invalid value for {field_name}: {e}")
+                return
 
+            # Validate enum/const constraints
+            if "enum" in field and parsed_value not in field["enum"]:
+                valid_options = ", ".join(str(e) for e in field["enum"])
+                self._add_message(
+                    "error",
+                    f"Invalid value. Must be one of: {valid_options}",
+                )
+                return
+            if "const" in field and parsed_value != field["const"]:
+                self._add_message("error", f"Value must be: {field['const']}")
+                return
+
+            self._add_message("user", f"{field_name} = {value}")
+            self._submit_elicitation_input(parsed_value)
+            terminal_input.value = ""
             return
 
         # Handle simple elicitation responses (legacy fallback for simple schemas)
@@ -604,21 +843,21 @@ class ToolTerminalScreen(Screen[None]):
                 return
 
             # Check for special commands
+            response: Any = value
             if value.lower() == "decline":
                 self._add_message("user", "Declining elicitation request")
                 self._elicitation_action = "decline"
-                self._elicitation_pending = False
+                response = _ELICITATION_ABORTED
             elif value.lower() == "cancel":
                 self._add_message("user", "Cancelling elicitation request")
                 self._elicitation_action = "cancel"
-                self._elicitation_pending = False
+                response = _ELICITATION_ABORTED
             else:
                 # Store the response
                 self._add_message("user", f"Response: {value}")
-                self._elicitation_response = value
                 self._elicitation_action = "accept"
-                self._elicitation_pending = False
 
+            self._submit_elicitation_input(response)
             terminal_input.value = ""
             return
 
@@ -639,26 +878,16 @@ class ToolTerminalScreen(Screen[None]):
         if self.current_param_index < len(self.selected_tool.parameters):
             param = self.selected_tool.parameters[self.current_param_index]
             parsed_value: Any = value
-            if param.type in ["object", "array"]:
+            parser = _TYPE_PARSERS.get(param.type)
+            if parser:
                 try:
-                    parsed_value = json.loads(value)
+                    parsed_value = parser(value)
                 except json.JSONDecodeError:
                     self._add_message("error", f"Invalid JSON for {param.type} parameter")
                     return
-            elif param.type == "number":
-                try:
-                    parsed_value = float(value)
-                except ValueError:
-                    self._add_message("error", f"Invalid number: {value}")
-                    return
-            elif param.type == "integer":
-                try:
-                    parsed_value = int(value)
                 except ValueError:
-                    self._add_message("error", f"Invalid integer: {value}")
+                    self._add_message("error", f"Invalid {param.type}: {value}")
                     return
-            elif param.type == "boolean":
-                parsed_value = value.lower() in ["true", "1", "yes"]
             self.tool_params[param.name] = parsed_value
             self._add_message("user", f"{param.name} = {value}")
             self.current_param_index += 1
@@ -693,8 +922,6 @@ class ToolTerminalScreen(Screen[None]):
         Returns:
             User's response in the appropriate type, or ElicitResult for explicit control
         """
-        import asyncio
-
         # Create elicitation record
         type_name = (
             getattr(response_type, "__name__", str(response_type)) if response_type else "None"
@@ -715,11 +942,10 @@ class ToolTerminalScreen(Screen[None]):
         # Parse elicitation schema to get fields from response_type dataclass
         self._elicitation_fields = self._parse_elicitation_schema(response_type, params)
         self._elicitation_field_values = {}
-        self._current_elicitation_field_index = 0
 
         # Enable input controls for elicitation
-        send_btn = self.query_one("#send-btn", Button)
-        terminal_input = self.query_one("#terminal-input", Input)
+        send_btn = self._send_btn
+        terminal_input = self._terminal_input
 
         send_btn.disabled = False
         terminal_input.disabled = False
@@ -727,30 +953,26 @@ class ToolTerminalScreen(Screen[None]):
         # Check if we have fields to collect
         if self._elicitation_fields:
             # Multi-field elicitation - show field overview
-            fields_summary = "\n".join(
-                f"  • {f['name']} ({f.get('type', 'string')})"
-                + (" [required]" if f.get("required", True) else " [optional]")
-                for f in self._elicitation_fields
-            )
-            self._add_message("system", f"Expected fields:\n{fields_summary}")
+            fields_summary = "\n".join(f["summary"] for f in self._elicitation_fields)
+            # Overview and instructions go out as one message rather than two
             self._add_message(
                 "system",
+                f"Expected fields:\n{fields_summary}\n\n"
                 "Enter values for each field. Type 'decline' or 'cancel' to abort.",
             )
 
-            # Start field collection
-            self._elicitation_collecting_fields = True
-            self._elicitation_pending = True
+            # Prompt for each field in turn; handle_send queues the value entered for it
             self._elicitation_action = "accept"
-
-            # Prompt for first field
-            self._prompt_next_elicitation_field()
-
             try:
-                # Wait for all fields to be collected
-                while self._elicitation_pending or self._elicitation_collecting_fields:
-                    await asyncio.sleep(0.1)
+                for field in self._elicitation_fields:
+                    self._prompt_elicitation_field(field)
+                    value = await self._elicitation_queue.get()
+                    if value is _ELICITATION_ABORTED:
+                        break
+                    if value is not _FIELD_SKIPPED:
+                        self._elicitation_field_values[field["name"]] = value
             finally:
+                self._elicitation_current_field = None
                 send_btn.disabled = True
                 terminal_input.disabled = True
 
@@ -783,29 +1005,31 @@ class ToolTerminalScreen(Screen[None]):
                 # Empty schema - just need acknowledgment
                 self._add_message("system", "Press Enter or type 'ok' to acknowledge")
             else:
-                self._add_message("system", f"Expected response type: {type_name}")
                 self._add_message(
-                    "system", "Type your response, or use 'decline' or 'cancel' commands"
+                    "system",
+                    f"Expected response type: {type_name}\n"
+                    "Type your response, or use 'decline' or 'cancel' commands",
                 )
 
             self._set_input_prompt("⏳ Elicitation response")
             terminal_input.focus()
 
-            # Set simple elicitation state
+            # Wait for the single response queued by handle_send
             self._elicitation_pending = True
-            self._elicitation_response = None
             self._elicitation_action = "accept"
 
             try:
-                while self._elicitation_pending:
-                    await asyncio.sleep(0.1)
+                response = await self._elicitation_queue.get()
             finally:
+                self._elicitation_pending = False
                 send_btn.disabled = True
                 terminal_input.disabled = True
+            if response is _ELICITATION_ABORTED:
+                response = None
 
             # Update elicitation record
             elicitation_record["action"] = self._elicitation_action
-            elicitation_record["response"] = self._elicitation_response
+            elicitation_record["response"] = response
             self._elicitation_history.append(elicitation_record)
 
             # Check action and return appropriate result
@@ -814,8 +1038,6 @@ class ToolTerminalScreen(Screen[None]):
             elif self._elicitation_action == "cancel":
                 return ElicitResult(action="cancel")
             else:
-                response = self._elicitation_response
-
                 # Handle empty schema (just acknowledge)
                 if response_type is None:
                     return {}
@@ -824,49 +1046,19 @@ class ToolTerminalScreen(Screen[None]):
                 if response is None:
                     return ElicitResult(action="decline")
 
-                # Try to parse response based on response_type
-                if hasattr(response_type, "__dataclass_fields__"):
-                    if isinstance(response, str):
-                        try:
-                            response_data = json.loads(response)
-                            return response_type(**response_data)
-                        except (json.JSONDecodeError, TypeError) as e:
-                            self._add_message("error", f"Failed to parse response: {e}")
-                            return ElicitResult(action="decline")
-                    elif isinstance(response, dict):
-                        return response_type(**response)
-
-                # For primitive types
-                if response_type is str:
-                    return str(response)
-                elif response_type is int:
-                    try:
-                        return int(response)
-                    except ValueError:
-                        return ElicitResult(action="decline")
-                elif response_type is float:
-                    try:
-                        return float(response)
-                    except ValueError:
-                        return ElicitResult(action="decline")
-                elif response_type is bool:
-                    return str(response).lower() in ["true", "1", "yes"]
-
-                return response
-
-    async def _log_handler(self, params: LoggingMessageNotificationParams) -> None:
-        """Handle log messages from the server."""
-        # Consume logs to prevent them from being printed to stdout
-        # Optionally we could display them in the TUI:
-        # self._add_message("system", f"Log [{params.level}]: {params.data}")
-        pass
+                # Convert the typed response with the coercer resolved once per type
+                try:
+                    return _response_coercer(response_type)(response)
+                except (ValueError, TypeError) as e:
+                    self._add_message("error", f"Failed to parse response: {e}")
+                    return ElicitResult(action="decline")
 
     @on(Button.Pressed, "#execute-btn")
     async def handle_execute(self, event: Button.Pressed) -> None:
         """Execute the selected tool with collected parameters.
 
-        Uses run_worker to execute in background, allowing the event loop
-        to continue processing events (like elicitation input) during execution.
+        Runs the tool in a background task, allowing the event loop to continue
+        processing events (like elicitation input) during execution.
         """
         if not self.selected_server or not self.selected_tool:
             self._add_message("error", "Please select a server and tool first")
@@ -878,69 +1070,45 @@ class ToolTerminalScreen(Screen[None]):
             return
 
         # Clear elicitation history at start of execution
-        self._elicitation_history = []
+        self._elicitation_history.clear()
 
-        params_str = json.dumps(self.tool_params, indent=2) if self.tool_params else "{}"
+        params_str = _dumps_json(self.tool_params) if self.tool_params else "{}"
         self._add_message(
             "user",
             f"Executing {self.selected_tool.name} with parameters:\n{params_str}",
         )
 
         # Disable UI controls during execution
-        send_btn = self.query_one("#send-btn", Button)
-        execute_btn = self.query_one("#execute-btn", Button)
-        terminal_input = self.query_one("#terminal-input", Input)
-        server_select = self.query_one("#server-select", Select)
-        tool_select = self.query_one("#tool-select", Select)
-
-        send_btn.disabled = True
-        execute_btn.disabled = True
-        terminal_input.disabled = True
-        server_select.disabled = True
-        tool_select.disabled = True
-
-        # Run tool execution in background worker to allow event loop to process
-        # elicitation input events
-        self.run_worker(
-            self._execute_tool_async(),
-            name="tool_execution",
-            exclusive=True,
-        )
+        self._set_controls_disabled(True)
+
+        # Run tool execution in a background task to allow event loop to process
+        # elicitation input events; a plain task skips Textual's worker bookkeeping
+        if self._exec_task is not None and not self._exec_task.done():
+            self._exec_task.cancel()
+        self._exec_task = asyncio.create_task(self._execute_tool_async(), name="tool_execution")
 
     async def _execute_tool_async(self) -> None:
         """Execute the tool in background, allowing elicitation to work properly."""
         if not self.selected_server or not self.selected_tool:
             return
 
-        send_btn = self.query_one("#send-btn", Button)
-        execute_btn = self.query_one("#execute-btn", Button)
-        terminal_input = self.query_one("#terminal-input", Input)
-        server_select = self.query_one("#server-select", Select)
-        tool_select = self.query_one("#tool-select", Select)
-
         try:
             # Use prefixed tool name for proxy
             prefixed_tool_name = f"{self.selected_server.name}_{self.selected_tool.name}"
 
-            # Connect to the proxy server (which supports elicitation forwarding)
-            proxy_url = f"http://localhost:{self.proxy_config.port}/mcp"
-            transport = StreamableHttpTransport(url=proxy_url)
-
-            # Create client with elicitation handler support
-            client = Client(
-                transport,
-                elicitation_handler=self._elicitation_handler,
-                log_handler=self._log_handler,
-            )
-
-            start_time = datetime.now()
-            async with client:
+            start_time = time.perf_counter()
+            client = await self._get_client()
+            try:
                 result = await client.call_tool(prefixed_tool_name, self.tool_params)
-            duration = (datetime.now() - start_time).total_seconds()
+            except Exception:
+                # The session may be broken (e.g. the proxy restarted); reconnect next time
+                await self._close_client()
+                raise
+            duration = time.perf_counter() - start_time
 
             # Format result with execution summary if elicitations occurred
             if self._elicitation_history:
-                result_str = self._format_execution_summary(result)
+                result_str = await self._format_execution_summary(result)
             else:
                 result_str = self._format_tool_result(result)
 
@@ -951,20 +1119,66 @@ class ToolTerminalScreen(Screen[None]):
         except Exception as e:
             self._add_message("error", f"Tool execution failed: {str(e)}")
         finally:
-            send_btn.disabled = False
-            execute_btn.disabled = False
-            terminal_input.disabled = False
-            server_select.disabled = False
-            tool_select.disabled = False
+            self._set_controls_disabled(False)
 
             self.tool_params = {}
             self.current_param_index = 0
             self._prompt_next_parameter()
 
+    async def _get_client(self) -> Client:
+        """Get the proxy client, connecting it on first use.
+
+        Returns:
+            Connected client for the proxy server
+        """
+        if self._client is None or self._client_stack is None:
+            # Connect to the proxy server (which supports elicitation forwarding)
+            proxy_url = f"http://localhost:{self.proxy_config.port}/mcp"
+            transport = StreamableHttpTransport(url=proxy_url)
+
+            # Create client with elicitation handler support
+            client = Client(
+                transport,
+                elicitation_handler=self._elicitation_handler,
+                log_handler=_null_log_handler,
+            )
+            stack = AsyncExitStack()
+            await stack.enter_async_context(client)
+            self._client = client
+            self._client_stack = stack
+        return self._client
+
+    async def _close_client(self) -> None:
+        """Disconnect the proxy client, if connected."""
+        stack = self._client_stack
+        self._client = None
+        self._client_stack = None
+        if stack is not None:
+            try:
+                await stack.aclose()
+            except Exception:
+                pass  # The connection is being discarded either way
+
+    async def on_unmount(self) -> None:
+        """Stop any running execution and disconnect from the proxy when the screen is closed."""
+        if self._exec_task is not None and not self._exec_task.done():
+            self._exec_task.cancel()
+        await self._close_client()
+
+    def _set_controls_disabled(self, disabled: bool) -> None:
+        """Enable or disable the input and selection controls."""
+        self._send_btn.disabled = disabled
+        self._execute_btn.disabled = disabled
+        self._terminal_input.disabled = disabled
+        self._tool_select.disabled = disabled
+        if self._server_select is not None:
+            self._server_select.disabled = disabled
+
     def action_clear_chat(self) -> None:
         """Clear the chat history."""
-        chat_area = self.query_one("#chat-area", VerticalScroll)
+        chat_area = self._chat_area
         chat_area.remove_children()
+        self._message_count = 1
         chat_area.mount(
             ChatMessage(
                 "system",
@@ -974,13 +1188,11 @@ class ToolTerminalScreen(Screen[None]):
 
     def action_scroll_up(self) -> None:
         """Scroll chat area up."""
-        chat_area = self.query_one("#chat-area", VerticalScroll)
-        chat_area.scroll_up()
+        self._chat_area.scroll_up()
 
     def action_scroll_down(self) -> None:
         """Scroll chat area down."""
-        chat_area = self.query_one("#chat-area", VerticalScroll)
-        chat_area.scroll_down()
+        self._chat_area.scroll_down()
 
     def action_go_back(self) -> None:
         """Go back to previous screen."""
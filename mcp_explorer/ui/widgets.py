@@ -1,113 +1,185 @@
 """Custom widgets for MCP Explorer."""
 
+import os
+from pathlib import Path
 from typing import Optional
 
 from rich.text import Text
 from textual.app import ComposeResult
-from textual.containers import Container, Horizontal, Vertical
+from textual.containers import Container, Horizontal
 from textual.widgets import Button, Label, ListItem, ListView, Static
 
 from ..models import MCPPrompt, MCPResource, MCPServer, MCPTool
 
 
-class ServerListItem(ListItem):
+def _shorten_home_path(config_file: str) -> str:
+    """Shorten a config file path inside the home directory to "~/..."."""
+    try:
+        home_prefix = str(Path.home()) + os.sep
+    except RuntimeError:
+        # Home directory can't be resolved; show the path as-is
+        return config_file
+    # Config paths come from Path objects, so a plain prefix check is enough
+    if config_file.startswith(home_prefix):
+        return f"~/{config_file[len(home_prefix) :]}"
+    return config_file
+
+
+class _TextListItem(ListItem):
+    """A list item rendering its lines as a single Text, styled by component classes.
+
+    The lines are built once from the item's data; the styled Text is cached until the
+    item's styles change.
+    """
+
+    def __init__(self, lines: list[tuple[str, str]]) -> None:
+        """Initialize the list item.
+
+        Args:
+            lines: The item's lines as (text, component class) pairs
+        """
+        super().__init__()
+        self._lines = lines
+        self._rendered: Text | None = None
+
+    def notify_style_update(self) -> None:
+        """Drop the cached Text when styles change, so it picks up the new ones."""
+        super().notify_style_update()
+        self._rendered = None
+
+    def render(self) -> Text:
+        """Render the item's lines, each styled by its CSS class."""
+        if self._rendered is None:
+            text = Text()
+            for index, (line, component_class) in enumerate(self._lines):
+                if index:
+                    text.append("\n")
+                style = self.get_component_rich_style(component_class, partial=True)
+                text.append(line, style=style)
+            self._rendered = text
+        return self._rendered
+
+
+class ServerListItem(_TextListItem):
     """A list item representing an MCP server."""
 
+    # Lines render as one Text styled by these CSS classes, rather than a Static per line
+    COMPONENT_CLASSES = {"server-name", "item-description", "server-status", "server-status-error"}
+
     def __init__(self, server: MCPServer) -> None:
         """Initialize the server list item."""
-        super().__init__()
+        super().__init__(self._build_lines(server))
         self.server = server
 
-    def compose(self) -> ComposeResult:
-        """Compose the server list item."""
-        with Vertical():
-            # Server name
-            yield Static(self.server.name, classes="server-name")
+    @staticmethod
+    def _build_status(server: MCPServer) -> tuple[str, str]:
+        """Build the status and capabilities line and its CSS class."""
+        status_class = "server-status-error" if server.status.value == "error" else "server-status"
 
-            # Description
-            if self.server.description:
-                yield Static(self.server.description, classes="item-description")
+        # At most four parts, so append to the string directly instead of joining a list
+        status_line = server.get_status_display()
+        if server.tools:
+            status_line += f" | Tools: {len(server.tools)}"
+        if server.resources:
+            status_line += f" | Resources: {len(server.resources)}"
+        if server.prompts:
+            status_line += f" | Prompts: {len(server.prompts)}"
 
-            # Status and capabilities
-            status_class = (
-                "server-status-error" if self.server.status.value == "error" else "server-status"
-            )
+        return status_line, status_class
 
-            # Build status line
-            status_parts = [self.server.get_status_display()]
-            if self.server.tools:
-                status_parts.append(f"Tools: {len(self.server.tools)}")
-            if self.server.resources:
-                status_parts.append(f"Resources: {len(self.server.resources)}")
-            if self.server.prompts:
-                status_parts.append(f"Prompts: {len(self.server.prompts)}")
+    @classmethod
+    def _build_lines(cls, server: MCPServer) -> list[tuple[str, str]]:
+        """Build the server list item's lines."""
+        # Server name
+        lines = [(server.name, "server-name")]
 
-            yield Static(" | ".join(status_parts), classes=status_class)
+        # Description
+        if server.description:
+            lines.append((server.description, "item-description"))
 
-            # Error message if present
-            if self.server.error_message:
-                yield Static(f"Error: {self.server.error_message}", classes="server-status-error")
+        # Status and capabilities
+        lines.append(cls._build_status(server))
 
+        # Error message if present
+        if server.error_message:
+            lines.append((f"Error: {server.error_message}", "server-status-error"))
 
-class ToolListItem(ListItem):
+        return lines
+
+
+class ToolListItem(_TextListItem):
     """A list item representing an MCP tool."""
 
+    COMPONENT_CLASSES = {"item-name", "item-description", "item-params"}
+
     def __init__(self, tool: MCPTool) -> None:
         """Initialize the tool list item."""
-        super().__init__()
+        super().__init__(self._build_lines(tool))
         self.tool = tool
 
-    def compose(self) -> ComposeResult:
-        """Compose the tool list item."""
-        with Vertical():
-            yield Static(self.tool.name, classes="item-name")
-            if self.tool.description:
-                yield Static(self.tool.description, classes="item-description")
+    @staticmethod
+    def _build_lines(tool: MCPTool) -> list[tuple[str, str]]:
+        """Build the tool list item's lines."""
+        lines = [(tool.name, "item-name")]
+        if tool.description:
+            lines.append((tool.description, "item-description"))
+
+        param_summary = tool.get_parameter_summary()
+        if param_summary and param_summary != "No parameters":
+            lines.append((param_summary, "item-params"))
 
-            param_summary = self.tool.get_parameter_summary()
-            if param_summary and param_summary != "No parameters":
-                yield Static(param_summary, classes="item-params")
+        return lines
 
 
-class ResourceListItem(ListItem):
+class ResourceListItem(_TextListItem):
     """A list item representing an MCP resource."""
 
+    COMPONENT_CLASSES = {"item-name", "item-description", "item-params"}
+
     def __init__(self, resource: MCPResource) -> None:
         """Initialize the resource list item."""
-        super().__init__()
+        super().__init__(self._build_lines(resource))
         self.resource = resource
 
-    def compose(self) -> ComposeResult:
-        """Compose the resource list item."""
-        with Vertical():
-            yield Static(self.resource.get_display_name(), classes="item-name")
-            yield Static(self.resource.uri, classes="item-description")
+    @staticmethod
+    def _build_lines(resource: MCPResource) -> list[tuple[str, str]]:
+        """Build the resource list item's lines."""
+        lines = [
+            (resource.get_display_name(), "item-name"),
+            (resource.uri, "item-description"),
+        ]
 
-            if self.resource.description:
-                yield Static(self.resource.description, classes="item-description")
+        if resource.description:
+            lines.append((resource.description, "item-description"))
 
-            if self.resource.mime_type:
-                yield Static(f"Type: {self.resource.mime_type}", classes="item-params")
+        if resource.mime_type:
+            lines.append((f"Type: {resource.mime_type}", "item-params"))
 
+        return lines
 
-class PromptListItem(ListItem):
+
+class PromptListItem(_TextListItem):
     """A list item representing an MCP prompt."""
 
+    COMPONENT_CLASSES = {"item-name", "item-description", "item-params"}
+
     def __init__(self, prompt: MCPPrompt) -> None:
         """Initialize the prompt list item."""
-        super().__init__()
+        super().__init__(self._build_lines(prompt))
         self.prompt = prompt
 
-    def compose(self) -> ComposeResult:
-        """Compose the prompt list item."""
-        with Vertical():
-            yield Static(self.prompt.name, classes="item-name")
-            if self.prompt.description:
-                yield Static(self.prompt.description, classes="item-description")
+    @staticmethod
+    def _build_lines(prompt: MCPPrompt) -> list[tuple[str, str]]:
+        """Build the prompt list item's lines."""
+        lines = [(prompt.name, "item-name")]
+        if prompt.description:
+            lines.append((prompt.description, "item-description"))
+
+        arg_summary = prompt.get_argument_summary()
+        if arg_summary and arg_summary != "No arguments":
+            lines.append((arg_summary, "item-params"))
 
-            arg_summary = self.prompt.get_argument_summary()
-            if arg_summary and arg_summary != "No arguments":
-                yield Static(arg_summary, classes="item-params")
+        return lines
 
 
 class ConfigFileHeader(ListItem):
@@ -120,24 +192,14 @@ class ConfigFileHeader(ListItem):
         self.server_count = server_count
         self.can_focus = False  # Headers cannot be selected
 
+        # Path and count don't change, so the header text is built once here
+        header_text = f"📁 {_shorten_home_path(config_file)}"
+        count_text = f"({server_count} server{'s' if server_count != 1 else ''})"
+        self._display = f"{header_text} {count_text}"
+
     def compose(self) -> ComposeResult:
         """Compose the config file header."""
-        from pathlib import Path
-
-        # Shorten path if it's in home directory
-        display_path = self.config_file
-        try:
-            path = Path(self.config_file)
-            home = Path.home()
-            if path.is_relative_to(home):
-                display_path = f"~/{path.relative_to(home)}"
-        except (ValueError, Exception):
-            pass
-
-        header_text = f"📁 {display_path}"
-        count_text = f"({self.server_count} server{'s' if self.server_count != 1 else ''})"
-
-        yield Static(f"{header_text} {count_text}", classes="config-file-header")
+        yield Static(self._display, classes="config-file-header")
 
 
 class DetailPanel(Container):
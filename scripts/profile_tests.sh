@@ -0,0 +1,20 @@
+#!/usr/bin/env bash
+# Profile the proxy restart and splash tests with cProfile.
+#
+# Usage: scripts/profile_tests.sh [output-file] [pytest args...]
+#
+# View the result with `snakeviz prof.out`, or print the top entries with
+# `python -m pstats prof.out` and `sort cumtime` / `stats 30` at its prompt.
+set -euo pipefail
+
+cd "$(dirname "$0")/.."
+
+out="${1:-prof.out}"
+shift || true
+
+if [ "$#" -eq 0 ]; then
+    set -- tests/test_proxy_restart.py tests/test_splash.py
+fi
+
+python -m cProfile -o "$out" -m pytest -q -p no:cacheprovider "$@"
+echo "Profile written to $out (view with: snakeviz $out)"
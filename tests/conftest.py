@@ -0,0 +1,95 @@
+"""Shared fixtures for the test scripts."""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from mcp_explorer.models import MCPServer
+from mcp_explorer.services.config_loader import MCPConfigLoader
+
+if TYPE_CHECKING:
+    from mcp_explorer.models import ProxyConfig
+    from mcp_explorer.proxy import ProxyServer
+    from mcp_explorer.ui.screens import SplashScreen
+
+# Upper bound on how long a test proxy may take to bind its port
+PROXY_READY_TIMEOUT = 2.0
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Only emit the tests' debug progress messages when running with -v."""
+    level = logging.DEBUG if config.getoption("verbose") > 0 else logging.WARNING
+    logging.getLogger("tests").setLevel(level)
+
+
+@pytest.fixture(scope="session")
+def loader() -> MCPConfigLoader:
+    """Config loader shared by all tests in the session."""
+    return MCPConfigLoader()
+
+
+@pytest.fixture(scope="session")
+def all_servers(loader: MCPConfigLoader) -> dict[str, dict[str, Any]]:
+    """Server configs from all config files, discovered once per session."""
+    return loader.discover_servers()
+
+
+@pytest.fixture(scope="session")
+def hierarchical(loader: MCPConfigLoader) -> list[dict[str, Any]]:
+    """Server configs grouped by config file, discovered once per session."""
+    return loader.discover_servers_hierarchical()
+
+
+@pytest.fixture(scope="session")
+def echo_server() -> MCPServer:
+    """Minimal stdio server config for tests that only need a backend to configure."""
+    return MCPServer(name="test-server", command="echo", args=["test"])
+
+
+@pytest.fixture(scope="module")
+def splash() -> Iterator["SplashScreen"]:
+    """Splash screen shared by the tests in a module, reset once they're done."""
+    # Imported here so only the tests that use it pay for loading Textual
+    from mcp_explorer.ui.screens import SplashScreen
+
+    screen = SplashScreen()
+    yield screen
+    screen.reset()
+
+
+@asynccontextmanager
+async def run_proxy(
+    config: "ProxyConfig", servers: list[MCPServer] | None = None
+) -> AsyncIterator["ProxyServer"]:
+    """Run a proxy server for the duration of the block, once it's listening.
+
+    The proxy is stopped on exit unless the block already stopped it.
+
+    Args:
+        config: Proxy configuration, e.g. with port 0 to bind any free port
+        servers: Backend servers to proxy
+    """
+    # Imported here so only the tests that use it pay for loading FastMCP
+    from mcp_explorer.proxy import ProxyLogger, ProxyServer
+
+    proxy = ProxyServer(servers=servers or [], config=config, logger=ProxyLogger())
+
+    # start() returns once the proxy has been stopped, which ends the task group
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(proxy.start())
+        await asyncio.wait_for(proxy._ready.wait(), timeout=PROXY_READY_TIMEOUT)
+        try:
+            yield proxy
+        finally:
+            if proxy.is_running():
+                await proxy.stop()
+
+
+@pytest.fixture
+def start_proxy() -> Callable[..., AbstractAsyncContextManager["ProxyServer"]]:
+    """Start a proxy server with `async with start_proxy(config, servers) as proxy:`."""
+    return run_proxy
@@ -1,12 +1,18 @@
 #!/usr/bin/env python3
 """Test that all servers from all config files are discovered hierarchically."""
 
+from typing import Any
+
 from mcp_explorer.services.config_loader import MCPConfigLoader
 
 
-def main():
-    loader = MCPConfigLoader()
-    config_files_data = loader.discover_servers_hierarchical()
+def test_all_configs(hierarchical: list[dict[str, Any]]) -> None:
+    """Report the servers discovered from each config file.
+
+    Args:
+        hierarchical: Server configs grouped by config file
+    """
+    config_files_data = hierarchical
 
     print("\n" + "=" * 70)
     print("HIERARCHICAL DISCOVERY RESULTS")
@@ -34,5 +40,10 @@ def main():
     print("=" * 70 + "\n")
 
 
+def main() -> None:
+    """Run the test outside pytest."""
+    test_all_configs(MCPConfigLoader().discover_servers_hierarchical())
+
+
 if __name__ == "__main__":
     main()
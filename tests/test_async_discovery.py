@@ -7,7 +7,7 @@ import sys
 import pytest
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_discovery():
     """Test server discovery with error handling."""
     print("🧪 Testing async server discovery...\n")
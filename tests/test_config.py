@@ -1,14 +1,22 @@
 #!/usr/bin/env python3
 """Test script to validate MCP configuration discovery."""
 
+import io
+import sys
+from contextlib import redirect_stdout
 from pathlib import Path
+from typing import Any
+
 from mcp_explorer.services.config_loader import MCPConfigLoader
 
 
-def main() -> None:
-    """Test configuration loading and validation."""
-    loader = MCPConfigLoader()
+def test_config(loader: MCPConfigLoader, all_servers: dict[str, dict[str, Any]]) -> None:
+    """Test configuration loading and validation.
 
+    Args:
+        loader: Config loader shared across the test session
+        all_servers: Servers discovered by the loader
+    """
     print("🔍 Searching for MCP configuration files...\n")
 
     config_paths = loader.get_config_paths()
@@ -65,12 +73,17 @@ def main() -> None:
 
         print(f"  ✓ Found {len(servers)} server(s):\n")
 
+        # Report entries that aren't objects first, keeping the rest for validation
+        server_configs = {}
         for name, server_config in servers.items():
-            print(f"    • {name}")
-
-            if not isinstance(server_config, dict):
+            if isinstance(server_config, dict):
+                server_configs[name] = server_config
+            else:
+                print(f"    • {name}")
                 print(f"      ❌ Invalid configuration")
-                continue
+
+        for name, server_config in server_configs.items():
+            print(f"    • {name}")
 
             # Validate server config
             is_valid, error_msg = loader.validate_server_config(name, server_config)
@@ -94,12 +107,23 @@ def main() -> None:
 
     # Discover all servers
     print("\n🌐 Discovering all servers...")
-    all_servers = loader.discover_servers()
 
     print(f"\n✓ Total servers discovered: {len(all_servers)}")
     for name in all_servers.keys():
         print(f"  • {name}")
 
 
+def main() -> None:
+    """Run the test outside pytest."""
+    loader = MCPConfigLoader()
+    test_config(loader, loader.discover_servers())
+
+
 if __name__ == "__main__":
-    main()
+    # Collect the report and write it once instead of once per print call
+    report = io.StringIO()
+    try:
+        with redirect_stdout(report):
+            main()
+    finally:
+        sys.stdout.write(report.getvalue())
@@ -1,12 +1,18 @@
 #!/usr/bin/env python3
 """Debug script to test config discovery."""
 
+from typing import Any
+
 from mcp_explorer.services.config_loader import MCPConfigLoader
 
 
-def main():
-    loader = MCPConfigLoader()
+def test_config_discovery(loader: MCPConfigLoader, all_servers: dict[str, dict[str, Any]]) -> None:
+    """Report config paths and the servers discovered from them.
 
+    Args:
+        loader: Config loader shared across the test session
+        all_servers: Servers discovered by the loader
+    """
     # Get all config paths
     paths = loader.get_config_paths()
     print(f"\n{'=' * 70}")
@@ -20,8 +26,6 @@ def main():
     print(f"STEP 2: Processing each config file")
     print(f"{'=' * 70}")
 
-    all_servers = loader.discover_servers()
-
     print(f"\n{'=' * 70}")
     print(f"STEP 3: Final results - Total servers: {len(all_servers)}")
     print(f"{'=' * 70}")
@@ -34,7 +38,8 @@ def main():
         source = config.get("_source_file", "Unknown")
         by_source[source].append(name)
 
-    for source, server_names in sorted(by_source.items()):
+    for source in sorted(by_source):
+        server_names = by_source[source]
         print(f"\n  📁 {source}")
         for name in server_names:
             print(f"      - {name}")
@@ -42,5 +47,11 @@ def main():
     print(f"\n{'=' * 70}\n")
 
 
+def main() -> None:
+    """Run the test outside pytest."""
+    loader = MCPConfigLoader()
+    test_config_discovery(loader, loader.discover_servers())
+
+
 if __name__ == "__main__":
     main()
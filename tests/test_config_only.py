@@ -1,16 +1,31 @@
 #!/usr/bin/env python3
 """Test configuration loading only (no server connections)."""
 
+import io
+import re
+import sys
+from collections import defaultdict
+from contextlib import redirect_stdout
+from typing import Any
+
 from mcp_explorer.services.config_loader import MCPConfigLoader
 
+# JSON5 feature patterns, each found with a single scan that stops at the first match
+COMMENT_RE = re.compile(r"//|/\*")
+UNQUOTED_KEY_RE = re.compile(r"[{,]\s*[A-Za-z_$][\w$]*\s*:")
+TRAILING_COMMA_RE = re.compile(r",\s*[}\]]")
+
+
+def test_config_only(loader: MCPConfigLoader, all_servers: dict[str, dict[str, Any]]) -> None:
+    """Test configuration loading.
 
-def main():
-    """Test configuration loading."""
+    Args:
+        loader: Config loader shared across the test session
+        all_servers: Servers discovered by the loader
+    """
     print("🔍 Testing MCP Configuration Loading\n")
     print("=" * 70)
 
-    loader = MCPConfigLoader()
-
     # Test 1: Find config files
     print("\n1️⃣  Configuration File Discovery")
     print("-" * 70)
@@ -39,22 +54,24 @@ def main():
     print("\n\n3️⃣  Configuration Loading")
     print("-" * 70)
 
-    all_servers = loader.discover_servers()
     print(f"\n✅ Loaded {len(all_servers)} server(s) total\n")
 
+    # Validate each server once; the analysis and the summary both use the results
+    validation = {
+        name: loader.validate_server_config(name, config) for name, config in all_servers.items()
+    }
+
     # Test 4: Analyze server configs
     print("\n4️⃣  Server Configuration Analysis")
     print("-" * 70)
 
     # Group by source file
-    by_source = {}
+    by_source = defaultdict(list)
     for name, config in all_servers.items():
         source = config.get("_source_file", "unknown")
-        if source not in by_source:
-            by_source[source] = []
         by_source[source].append((name, config))
 
-    for source_file, servers in by_source.items():
+    for source_file, servers in sorted(by_source.items()):
         print(f"\n📁 {source_file}")
         print(f"   Servers: {len(servers)}")
 
@@ -64,7 +81,7 @@ def main():
             print(f"      Type: {server_type}")
 
             # Validate
-            is_valid, error = loader.validate_server_config(name, config)
+            is_valid, error = validation[name]
             if is_valid:
                 print(f"      ✅ Valid configuration")
             else:
@@ -94,7 +111,9 @@ def main():
     print("-" * 70)
 
     for path in config_paths:
-        config = loader.load_config_file(path)
+        # Read each file once, for both parsing and JSON5 feature detection
+        content = path.read_text()
+        config = loader.parse_config_content(content, path)
         if not config:
             continue
 
@@ -110,15 +129,12 @@ def main():
         print(f"   Schema: {schema_type}")
 
         # Check for JSON5 features
-        with open(path, "r") as f:
-            content = f.read()
-
         features = []
-        if "//" in content or "/*" in content:
+        if COMMENT_RE.search(content):
             features.append("comments")
-        if content.count('"') < content.count(":"):
+        if UNQUOTED_KEY_RE.search(content):
             features.append("unquoted keys")
-        if ",\n  }" in content or ",\n}" in content:
+        if TRAILING_COMMA_RE.search(content):
             features.append("trailing commas")
 
         if features:
@@ -130,11 +146,16 @@ def main():
     print("\n\n6️⃣  Summary Statistics")
     print("-" * 70)
 
-    stdio_count = sum(1 for c in all_servers.values() if c.get("type", "stdio") == "stdio")
-    sse_count = sum(1 for c in all_servers.values() if c.get("type") == "sse")
-    valid_count = sum(
-        1 for name, c in all_servers.items() if loader.validate_server_config(name, c)[0]
-    )
+    # Count types and valid configurations in a single pass
+    stdio_count = sse_count = valid_count = 0
+    for name, c in all_servers.items():
+        server_type = c.get("type", "stdio")
+        if server_type == "stdio":
+            stdio_count += 1
+        elif server_type == "sse":
+            sse_count += 1
+        if validation[name][0]:
+            valid_count += 1
     invalid_count = len(all_servers) - valid_count
 
     print(f"\n  Total servers: {len(all_servers)}")
@@ -162,5 +183,17 @@ def main():
     print("✅ All tests completed successfully!")
 
 
+def main() -> None:
+    """Run the test outside pytest."""
+    loader = MCPConfigLoader()
+    test_config_only(loader, loader.discover_servers())
+
+
 if __name__ == "__main__":
-    main()
+    # Collect the report and write it once instead of once per print call
+    report = io.StringIO()
+    try:
+        with redirect_stdout(report):
+            main()
+    finally:
+        sys.stdout.write(report.getvalue())
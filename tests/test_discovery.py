@@ -2,15 +2,25 @@
 """Test script to verify MCP server discovery from both Claude and GitHub Copilot configs."""
 
 import asyncio
+import io
+import sys
+from contextlib import redirect_stdout
+from itertools import islice
+from typing import Any
 
 import pytest
 
+from mcp_explorer.services.config_loader import MCPConfigLoader
 from mcp_explorer.services.discovery import MCPDiscoveryService
 
 
-@pytest.mark.asyncio
-async def test_discovery():
-    """Test server discovery."""
+@pytest.mark.asyncio(loop_scope="session")
+async def test_discovery(all_servers: dict[str, dict[str, Any]]):
+    """Test server discovery.
+
+    Args:
+        all_servers: Server configs discovered by the session's config loader
+    """
     print("🔍 Testing MCP Server Discovery\n")
     print("=" * 70)
 
@@ -26,7 +36,7 @@ async def test_discovery():
     # Show all servers from configs
     print("\n🔧 Servers in Configurations:")
     print("-" * 70)
-    all_configs = service.config_loader.discover_servers()
+    all_configs = all_servers
 
     for name, config in all_configs.items():
         server_type = config.get("type", "stdio")
@@ -54,81 +64,97 @@ async def test_discovery():
     # Discover servers (this will attempt to connect)
     print("\n\n🌐 Attempting to Connect to Servers...")
     print("-" * 70)
-    print("Note: This may take a few seconds per server.\n")
+    print("Note: This may take a few seconds per server.\n", flush=True)
 
     servers = await service.discover_all_servers()
 
-    print(f"\n✅ Discovery Complete: {len(servers)} servers")
-    print("=" * 70)
-
-    # Show results
-    for server in servers:
-        print(f"\n🖥  {server.name}")
-        print(f"   Type: {server.server_type.value.upper()}")
-        print(f"   Status: {server.get_status_display()}")
-
-        if server.description:
-            print(f"   Description: {server.description}")
-
-        if server.server_type.value == "stdio" and server.command:
-            print(f"   Command: {server.command}")
-        elif server.server_type.value == "sse" and server.url:
-            print(f"   URL: {server.url}")
-
-        # Show capabilities
-        print(f"   Capabilities: {server.get_capabilities_summary()}")
-
-        if server.tools:
-            print(f"   Tools ({len(server.tools)}):")
-            for tool in server.tools[:3]:
-                print(f"     - {tool.name}")
-            if len(server.tools) > 3:
-                print(f"     ... and {len(server.tools) - 3} more")
-
-        if server.resources:
-            print(f"   Resources ({len(server.resources)}):")
-            for resource in server.resources[:3]:
-                print(f"     - {resource.name}")
-            if len(server.resources) > 3:
-                print(f"     ... and {len(server.resources) - 3} more")
-
-        if server.prompts:
-            print(f"   Prompts ({len(server.prompts)}):")
-            for prompt in server.prompts[:3]:
-                print(f"     - {prompt.name}")
-            if len(server.prompts) > 3:
-                print(f"     ... and {len(server.prompts) - 3} more")
-
-        if server.error_message:
-            print(f"   ❌ Error: {server.error_message}")
-
-    # Summary by type
-    print("\n\n📊 Summary by Type:")
-    print("-" * 70)
-    stdio_servers = [s for s in servers if s.server_type.value == "stdio"]
-    sse_servers = [s for s in servers if s.server_type.value == "sse"]
-
-    print(f"  STDIO servers: {len(stdio_servers)}")
-    for s in stdio_servers:
-        print(f"    - {s.name} ({s.status.value})")
-
-    print(f"\n  SSE servers: {len(sse_servers)}")
-    for s in sse_servers:
-        print(f"    - {s.name} ({s.status.value})")
-
-    # Summary by status
-    print("\n📈 Summary by Status:")
-    print("-" * 70)
-    connected = [s for s in servers if s.status.value == "connected"]
-    errored = [s for s in servers if s.status.value == "error"]
-
-    print(f"  ✅ Connected: {len(connected)}")
-    print(f"  ❌ Errored: {len(errored)}")
-    print(f"  ○ Other: {len(servers) - len(connected) - len(errored)}")
+    # Collect the results report and write it once instead of once per print call
+    report = io.StringIO()
+    with redirect_stdout(report):
+        print(f"\n✅ Discovery Complete: {len(servers)} servers")
+        print("=" * 70)
+
+        # Show results
+        for server in servers:
+            server_type = server.server_type.value
+            print(f"\n🖥  {server.name}")
+            print(f"   Type: {server_type.upper()}")
+            print(f"   Status: {server.get_status_display()}")
+
+            if server.description:
+                print(f"   Description: {server.description}")
+
+            if server_type == "stdio" and server.command:
+                print(f"   Command: {server.command}")
+            elif server_type == "sse" and server.url:
+                print(f"   URL: {server.url}")
+
+            # Show capabilities
+            print(f"   Capabilities: {server.get_capabilities_summary()}")
+
+            if server.tools:
+                print(f"   Tools ({len(server.tools)}):")
+                for tool in islice(server.tools, 3):
+                    print(f"     - {tool.name}")
+                if len(server.tools) > 3:
+                    print(f"     ... and {len(server.tools) - 3} more")
+
+            if server.resources:
+                print(f"   Resources ({len(server.resources)}):")
+                for resource in islice(server.resources, 3):
+                    print(f"     - {resource.name}")
+                if len(server.resources) > 3:
+                    print(f"     ... and {len(server.resources) - 3} more")
+
+            if server.prompts:
+                print(f"   Prompts ({len(server.prompts)}):")
+                for prompt in islice(server.prompts, 3):
+                    print(f"     - {prompt.name}")
+                if len(server.prompts) > 3:
+                    print(f"     ... and {len(server.prompts) - 3} more")
+
+            if server.error_message:
+                print(f"   ❌ Error: {server.error_message}")
+
+        # Bucket servers by type and status in a single pass for both summaries
+        stdio_servers, sse_servers, connected, errored = [], [], [], []
+        for s in servers:
+            server_type = s.server_type.value
+            if server_type == "stdio":
+                stdio_servers.append(s)
+            elif server_type == "sse":
+                sse_servers.append(s)
+
+            status = s.status.value
+            if status == "connected":
+                connected.append(s)
+            elif status == "error":
+                errored.append(s)
+
+        # Summary by type
+        print("\n\n📊 Summary by Type:")
+        print("-" * 70)
+
+        print(f"  STDIO servers: {len(stdio_servers)}")
+        for s in stdio_servers:
+            print(f"    - {s.name} ({s.status.value})")
+
+        print(f"\n  SSE servers: {len(sse_servers)}")
+        for s in sse_servers:
+            print(f"    - {s.name} ({s.status.value})")
+
+        # Summary by status
+        print("\n📈 Summary by Status:")
+        print("-" * 70)
+
+        print(f"  ✅ Connected: {len(connected)}")
+        print(f"  ❌ Errored: {len(errored)}")
+        print(f"  ○ Other: {len(servers) - len(connected) - len(errored)}")
+    sys.stdout.write(report.getvalue())
 
     # Cleanup
     service.cleanup()
 
 
 if __name__ == "__main__":
-    asyncio.run(test_discovery())
+    asyncio.run(test_discovery(MCPConfigLoader().discover_servers()))
@@ -1,14 +1,22 @@
 #!/usr/bin/env python3
 """Test that all config files are being discovered and processed."""
 
+import io
 import sys
+from contextlib import redirect_stderr
 from pathlib import Path
+from typing import Any
+
 from mcp_explorer.services.config_loader import MCPConfigLoader
 
 
-def main():
-    loader = MCPConfigLoader()
+def test_multi_config(loader: MCPConfigLoader, all_servers: dict[str, dict[str, Any]]) -> None:
+    """Report every config file and the servers discovered from each.
 
+    Args:
+        loader: Config loader shared across the test session
+        all_servers: Servers discovered by the loader
+    """
     # Step 1: Get all config paths
     paths = loader.get_config_paths()
     print(f"\n{'=' * 70}", file=sys.stderr)
@@ -29,8 +37,6 @@ def main():
     print(f"Starting server discovery...", file=sys.stderr)
     print(f"{'=' * 70}\n", file=sys.stderr)
 
-    all_servers = loader.discover_servers()
-
     # Step 3: Show results grouped by source
     print(f"\n{'=' * 70}", file=sys.stderr)
     print(f"FINAL RESULTS", file=sys.stderr)
@@ -44,7 +50,7 @@ def main():
         by_source[source].append(name)
 
     print(f"\nServers grouped by config file:", file=sys.stderr)
-    for source in sorted(by_source.keys()):
+    for source in sorted(by_source):
         server_names = by_source[source]
         print(f"\n📁 {source}", file=sys.stderr)
         print(
@@ -61,5 +67,17 @@ def main():
     print(f"{'=' * 70}\n", file=sys.stderr)
 
 
+def main() -> None:
+    """Run the test outside pytest."""
+    loader = MCPConfigLoader()
+    test_multi_config(loader, loader.discover_servers())
+
+
 if __name__ == "__main__":
-    main()
+    # Collect the report and write it once instead of once per print call
+    report = io.StringIO()
+    try:
+        with redirect_stderr(report):
+            main()
+    finally:
+        sys.stderr.write(report.getvalue())
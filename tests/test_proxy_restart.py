@@ -1,75 +1,64 @@
 """Test proxy server restart functionality."""
 
 import asyncio
+import logging
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
 
 import pytest
 
 from mcp_explorer.models import MCPServer, ProxyConfig
-from mcp_explorer.proxy import ProxyLogger, ProxyServer
-
-
-@pytest.mark.asyncio
-async def test_restart():
-    """Test that proxy can be stopped and restarted multiple times."""
-    # Create minimal config
-    config = ProxyConfig(enabled=True, port=3001)
-    logger = ProxyLogger()
-
-    # Create a simple test server
-    server = MCPServer(name="test-server", command="echo", args=["test"])
-
-    print("Test 1: Start proxy server...")
-    proxy = ProxyServer(servers=[server], config=config, logger=logger)
-
-    # Start in background
-    start_task = asyncio.create_task(proxy.start())
-    await asyncio.sleep(1)  # Give it time to start
-
-    print(f"  Proxy running: {proxy.is_running()}")
-    assert proxy.is_running(), "Proxy should be running"
-
-    print("Test 2: Stop proxy server...")
-    await proxy.stop()
-
-    print(f"  Proxy running: {proxy.is_running()}")
+from mcp_explorer.proxy import ProxyServer
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_restart(
+    start_proxy: Callable[..., AbstractAsyncContextManager[ProxyServer]],
+    echo_server: MCPServer,
+) -> None:
+    """Test that proxy can be stopped and restarted multiple times.
+
+    Args:
+        start_proxy: Runs a proxy server for the duration of an async with block
+        echo_server: Simple backend server config shared by the session
+    """
+    logger.debug("Test 1: Start proxy server...")
+    # Create minimal config, binding any free port
+    config = ProxyConfig(enabled=True, port=0)
+    async with start_proxy(config, [echo_server]) as proxy:
+        logger.debug(f"  Proxy running: {proxy.is_running()} on port {proxy.port}")
+        assert proxy.is_running(), "Proxy should be running"
+        assert proxy.port != 0, "Proxy should report the port it bound"
+
+        logger.debug("Test 2: Stop proxy server...")
+        await proxy.stop()
+
+    logger.debug(f"  Proxy running: {proxy.is_running()}")
     assert not proxy.is_running(), "Proxy should be stopped"
 
-    # Cancel the start task
-    if not start_task.done():
-        start_task.cancel()
-        try:
-            await start_task
-        except asyncio.CancelledError:
-            pass
-
-    print("  Waiting for port to be released...")
-    await asyncio.sleep(1.0)  # Give OS more time to release the port
-
-    print("Test 3: Create and start new proxy on same port...")
-    proxy2 = ProxyServer(servers=[server], config=config, logger=logger)
-    start_task2 = asyncio.create_task(proxy2.start())
-    await asyncio.sleep(1)  # Give it time to start
+    logger.debug("Test 3: Create and start new proxy on same port...")
+    config2 = ProxyConfig(enabled=True, port=proxy.port)
+    async with start_proxy(config2, [echo_server]) as proxy2:
+        logger.debug(f"  Proxy running: {proxy2.is_running()} on port {proxy2.port}")
+        assert proxy2.is_running(), "Second proxy should be running"
 
-    print(f"  Proxy running: {proxy2.is_running()}")
-    assert proxy2.is_running(), "Second proxy should be running"
+        logger.debug("Test 4: Stop second proxy...")
+        await proxy2.stop()
 
-    print("Test 4: Stop second proxy...")
-    await proxy2.stop()
-    await asyncio.sleep(0.5)
-
-    print(f"  Proxy running: {proxy2.is_running()}")
+    logger.debug(f"  Proxy running: {proxy2.is_running()}")
     assert not proxy2.is_running(), "Second proxy should be stopped"
+    assert proxy2._stopped.is_set(), "Second proxy should have released its port"
 
-    # Cleanup
-    if not start_task2.done():
-        start_task2.cancel()
-        try:
-            await start_task2
-        except asyncio.CancelledError:
-            pass
-
-    print("\n✅ All tests passed! Proxy can be restarted multiple times.")
+    logger.debug("\n✅ All tests passed! Proxy can be restarted multiple times.")
 
 
 if __name__ == "__main__":
-    asyncio.run(test_restart())
+    from conftest import run_proxy
+
+    logging.basicConfig(format="%(message)s")
+    logger.setLevel(logging.DEBUG)
+    asyncio.run(
+        test_restart(run_proxy, MCPServer(name="test-server", command="echo", args=["test"]))
+    )
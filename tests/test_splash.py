@@ -1,39 +1,120 @@
-"""Test splash screen display."""
+"""Test splash screen display and animation."""
 
 import asyncio
-from mcp_explorer.ui.screens import SplashScreen
+import logging
+import sys
+from functools import partial
+
+import pytest
 from textual.app import App
+from textual.logging import TextualHandler
+
+from mcp_explorer.ui.screens import SplashScreen
+
+logger = logging.getLogger(__name__)
 
 
 class TestApp(App):
     """Test app to verify splash screen works."""
 
+    __test__ = False  # An app driven by test_splash, not a test class itself
+
+    # Run the splash animation and the status steps this many times faster than real time
+    ANIMATION_SPEED = 10.0
+
+    # Number of status updates shown, evenly spaced
+    STEPS = 4
+
+    # Safety net: exit after this many seconds if the splash never finishes
+    EXIT_TIMEOUT = 5.0
+
+    def __init__(self, splash: SplashScreen | None = None, mode: str = "status") -> None:
+        """Initialize the test app.
+
+        Args:
+            splash: Splash screen to show, e.g. one shared between tests; a new one if omitted
+            mode: "status" to step through status updates, "animation" to only animate
+        """
+        super().__init__()
+        self.splash = splash or SplashScreen()
+        self.mode = mode
+        self._steps_done = asyncio.Event()
+        self.animation_finished = asyncio.Event()
+
     def on_mount(self) -> None:
         """Show splash screen on mount."""
+        self.set_timer(self.EXIT_TIMEOUT, self._exit_on_timeout)
         self.run_worker(self._animate_splash, exclusive=True)
 
+    def _exit_on_timeout(self) -> None:
+        """Exit if the splash hasn't finished in time."""
+        logger.warning(f"Splash didn't finish within {self.EXIT_TIMEOUT}s, exiting")
+        self.exit()
+
+    def on_splash_screen_animation_finished(self) -> None:
+        """Note that the logo animation has completed a full cycle."""
+        self.animation_finished.set()
+
+    def _update_step(self, splash: SplashScreen, step: int) -> None:
+        """Show one status step on the splash screen."""
+        splash.update_status(f"Step {step}/{self.STEPS}", step * 100 / self.STEPS)
+        logger.debug(f"Updated splash: Step {step}")
+        if step == self.STEPS:
+            self._steps_done.set()
+
     async def _animate_splash(self) -> None:
         """Animate the splash screen."""
-        # Create and push splash screen
-        splash = SplashScreen()
-        await self.push_screen(splash)
+        step_interval = 1.0 / self.ANIMATION_SPEED
 
-        # Wait for it to render
-        await asyncio.sleep(0.5)
+        # Push the splash screen
+        splash = self.splash
+        splash.set_animation_speed(self.ANIMATION_SPEED)
+        await self.push_screen(splash)
 
-        print(f"Current screen: {type(self.screen).__name__}")
-        print("Splash screen is active!")
+        logger.debug(f"Current screen: {type(self.screen).__name__}")
+        logger.debug("Splash screen is active!")
 
-        for i in range(4):
-            await asyncio.sleep(1.0)
-            splash.update_status(f"Step {i + 1}/4", (i + 1) * 25)
-            print(f"Updated splash: Step {i + 1}")
+        if self.mode == "animation":
+            # Exit as soon as the logo gradient has gone through the whole palette
+            await self.animation_finished.wait()
+        else:
+            # Schedule every step up front, then exit as soon as the last one has been shown
+            for step in range(1, self.STEPS + 1):
+                self.set_timer(step * step_interval, partial(self._update_step, splash, step))
+            await self._steps_done.wait()
 
-        await asyncio.sleep(1.0)
-        print("Exiting...")
+        logger.debug("Exiting...")
         self.exit()
 
 
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.parametrize("mode", ["animation", "status"])
+async def test_splash(splash: SplashScreen, mode: str) -> None:
+    """Test that the splash screen animates and steps through its status updates.
+
+    Args:
+        splash: Splash screen shared by the module's tests
+        mode: Which part of the splash screen to exercise
+    """
+    splash.reset()
+    app = TestApp(splash, mode)
+    # Wide enough for the whole logo, so the full-speed frame interval is used
+    async with app.run_test(size=(120, 40)) as pilot:
+        await pilot.pause()
+        assert app.screen is splash, "Splash screen should be active"
+        await app.workers.wait_for_complete()
+
+    if mode == "animation":
+        assert app.animation_finished.is_set(), "Logo animation should have completed a cycle"
+    else:
+        assert splash._status_message == f"Step {TestApp.STEPS}/{TestApp.STEPS}"
+        assert splash._progress_percent == 100
+
+
 if __name__ == "__main__":
-    app = TestApp()
+    # Route log output to the Textual devtools console, as print() was
+    logging.basicConfig(handlers=[TextualHandler()])
+    logger.setLevel(logging.DEBUG)
+    # Pass "animation" to only animate the logo, without status updates
+    app = TestApp(mode=sys.argv[1] if len(sys.argv) > 1 else "status")
     app.run()